@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import argparse
+import json
+import numpy as np
+import os
+import platform
+import runpy
+import sheardata as sd
+import sqlite3
+import sys
+import tempfile
+import time
+
+# Benchmarks the database using a synthetic database, which can be much larger
+# than the real one.  The synthetic database is created using the same
+# functions as the preprocessing scripts: one duct flow study of fully-
+# developed pipe flow stations, each with a profile of points whose first
+# point is on the wall and last point is on the center line.  The results are
+# written as JSON so that they can be compared across versions.
+#
+# Run this from the source directory, since create_tables.py reads the data
+# directory relative to it:
+#
+#     PYTHONPATH=`pwd` python3 ../benchmarks/benchmark.py --stations 1000 \
+#         --points 500 --quantities 40 --output benchmark.json
+
+flow_class   = sd.DUCT_FLOW_CLASS
+year         = 2021
+study_number = 1
+
+stations_per_series = 100
+
+# The profile quantities always include the distance from the wall and the
+# streamwise velocity (for get_twin_profiles).  The remaining quantities are
+# taken from the quantities table.
+profile_quantities = [ sd.Q_DISTANCE_FROM_WALL, sd.Q_STREAMWISE_VELOCITY, ]
+
+# The wall quantities match the conditions in post_duct_flow_figures.py.
+wall_quantities = [ sd.Q_INNER_LAYER_ROUGHNESS_HEIGHT,
+                    sd.Q_CENTER_LINE_TO_WALL_TEMPERATURE_RATIO,
+                    sd.Q_FANNING_FRICTION_FACTOR, ]
+
+class Timer:
+    def __enter__( self ):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__( self, *args ):
+        self.seconds = time.perf_counter() - self.start
+
+def record( timings, name, timer, operations ):
+    timings[name] = {
+        "seconds":                timer.seconds,
+        "operations":             int(operations),
+        "operations_per_second":  int(operations) / max( timer.seconds, 1.0e-9 ),
+    }
+
+def run_script( script, database ):
+    argv = sys.argv
+    sys.argv = [ script, database ]
+    try:
+        runpy.run_path( script, run_name="__main__" )
+    finally:
+        sys.argv = argv
+
+def select_profile_quantities( cursor, n_quantities ):
+    quantities = list(profile_quantities)
+    excluded   = set( profile_quantities + wall_quantities )
+    cursor.execute(
+    """
+    SELECT identifier
+    FROM quantities
+    ORDER BY identifier;
+    """
+    )
+    for result in cursor.fetchall():
+        if ( len(quantities) >= n_quantities ):
+            break
+        if ( str(result[0]) not in excluded ):
+            quantities.append( str(result[0]) )
+    return quantities
+
+def generate( cursor, n_stations, n_points, quantities, rng ):
+    study = sd.add_study(
+        cursor,
+        flow_class=flow_class,
+        year=year,
+        study_number=study_number,
+        study_type=sd.DIRECT_NUMERICAL_SIMULATION_STUDY_TYPE,
+    )
+
+    n_point_values = 0
+    stations = []
+    for i_station in range(n_stations):
+        series_number  = i_station // stations_per_series + 1
+        station_number = i_station  % stations_per_series + 1
+
+        if ( station_number == 1 ):
+            series = sd.add_series(
+                cursor,
+                flow_class=flow_class,
+                year=year,
+                study_number=study_number,
+                series_number=series_number,
+                number_of_dimensions=2,
+                coordinate_system=sd.CYLINDRICAL_COORDINATE_SYSTEM,
+            )
+            sd.update_series_geometry( cursor, series, sd.ELLIPTICAL_GEOMETRY )
+
+        station = sd.add_station(
+            cursor,
+            flow_class=flow_class,
+            year=year,
+            study_number=study_number,
+            series_number=series_number,
+            station_number=station_number,
+        )
+        sd.mark_station_as_periodic( cursor, station )
+        stations.append( station )
+
+        bulk_reynolds_number = 10.0**rng.uniform( 2.0, 5.0 )
+        station_values = {
+            sd.Q_ASPECT_RATIO:                       1.0,
+            sd.Q_BULK_MACH_NUMBER:                   rng.uniform( 0.0, 0.5 ),
+            sd.Q_BULK_REYNOLDS_NUMBER:               bulk_reynolds_number,
+            sd.Q_BULK_TO_CENTER_LINE_VELOCITY_RATIO: rng.uniform( 0.6, 0.9 ),
+            sd.Q_OUTER_LAYER_DEVELOPMENT_LENGTH:     rng.uniform( 0.0, 100.0 ),
+        }
+        for quantity in station_values:
+            sd.set_station_value(
+                cursor,
+                station,
+                quantity,
+                sd.sdfloat( station_values[quantity], 0.0 ),
+                averaging_system=sd.UNWEIGHTED_AVERAGING_SYSTEM,
+            )
+
+        distance_from_wall = np.linspace( 0.0, 1.0, n_points )
+        for i_point in range(n_points):
+            point_label = None
+            if ( i_point == 0 ):
+                point_label = sd.WALL_POINT_LABEL
+            elif ( i_point == n_points-1 ):
+                point_label = sd.CENTER_LINE_POINT_LABEL
+
+            point = sd.add_point(
+                cursor,
+                flow_class=flow_class,
+                year=year,
+                study_number=study_number,
+                series_number=series_number,
+                station_number=station_number,
+                point_number=i_point+1,
+                point_label=point_label,
+            )
+
+            for quantity in quantities:
+                value = rng.normal()
+                if ( quantity == sd.Q_DISTANCE_FROM_WALL ):
+                    value = distance_from_wall[i_point]
+                elif ( quantity == sd.Q_STREAMWISE_VELOCITY ):
+                    value = distance_from_wall[i_point]**(1.0/7.0)
+                sd.set_point_value(
+                    cursor,
+                    point,
+                    quantity,
+                    sd.sdfloat( value, 0.01 * abs(value) ),
+                    averaging_system=sd.UNWEIGHTED_AVERAGING_SYSTEM,
+                )
+                n_point_values += 1
+
+            if ( point_label == sd.WALL_POINT_LABEL ):
+                wall_values = {
+                    sd.Q_INNER_LAYER_ROUGHNESS_HEIGHT:          0.0,
+                    sd.Q_CENTER_LINE_TO_WALL_TEMPERATURE_RATIO: 1.0,
+                    sd.Q_FANNING_FRICTION_FACTOR:
+                        0.079 * bulk_reynolds_number**(-0.25),
+                }
+                for quantity in wall_values:
+                    sd.set_point_value(
+                        cursor,
+                        point,
+                        quantity,
+                        sd.sdfloat( wall_values[quantity], 0.0 ),
+                        averaging_system=sd.UNWEIGHTED_AVERAGING_SYSTEM,
+                    )
+                    n_point_values += 1
+
+    return stations, n_point_values
+
+# The same station query as post_duct_flow_figures.py, for pipe flow and the
+# Fanning friction factor, with or without the station summary.
+def query_duct_flow_stations( cursor, summary=False ):
+    station_query = sd.StationQuery( summary=summary )
+    station_query.flow_class( sd.DUCT_FLOW_CLASS )
+    station_query.study_type( sd.DIRECT_NUMERICAL_SIMULATION_STUDY_TYPE )
+    station_query.number_of_dimensions( 2 )
+    station_query.coordinate_system( sd.CYLINDRICAL_COORDINATE_SYSTEM )
+    station_query.geometry( sd.ELLIPTICAL_GEOMETRY )
+    station_query.fully_developed()
+    station_query.point_value(
+        sd.Q_INNER_LAYER_ROUGHNESS_HEIGHT,
+        maximum=1.0,
+        include_maximum=False,
+    )
+    station_query.station_value( sd.Q_ASPECT_RATIO, 1.0, 1.0 )
+    station_query.station_value(
+        sd.Q_BULK_MACH_NUMBER,
+        0.0,
+        0.8,
+        include_maximum=False,
+    )
+    station_query.station_value(
+        sd.Q_OUTER_LAYER_DEVELOPMENT_LENGTH,
+        minimum=50.0,
+    )
+    station_query.labeled_value(
+        sd.WALL_POINT_LABEL,
+        sd.Q_CENTER_LINE_TO_WALL_TEMPERATURE_RATIO,
+        0.9,
+        1.1,
+    )
+    station_query.station_value( sd.Q_BULK_REYNOLDS_NUMBER )
+    station_query.labeled_value(
+        sd.WALL_POINT_LABEL,
+        sd.Q_FANNING_FRICTION_FACTOR,
+    )
+    return station_query.fetch( cursor )
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the database using a synthetic database."
+    )
+    parser.add_argument( "--stations",   type=int, default=100 )
+    parser.add_argument( "--points",     type=int, default=100 )
+    parser.add_argument( "--quantities", type=int, default=10 )
+    parser.add_argument( "--seed",       type=int, default=0 )
+    parser.add_argument( "--database", default=None,
+                         help="database to create (a temporary file by default)" )
+    parser.add_argument( "--output", default=None,
+                         help="JSON file for the results (standard output by default)" )
+    args = parser.parse_args()
+
+    if ( args.stations > stations_per_series * 999 ):
+        parser.error( "too many stations" )
+    if ( args.points > 9999 ):
+        parser.error( "too many points" )
+
+    temporary_directory = None
+    database = args.database
+    if ( database == None ):
+        temporary_directory = tempfile.TemporaryDirectory()
+        database = os.path.join( temporary_directory.name, "benchmark.db" )
+    elif ( os.path.exists( database ) ):
+        os.remove( database )
+
+    source_directory = os.path.dirname( os.path.abspath( sd.__file__ ) )
+    rng = np.random.default_rng( args.seed )
+
+    timings = {}
+
+    with Timer() as timer:
+        run_script( os.path.join( source_directory, "create_tables.py" ), database )
+    record( timings, "create_tables", timer, 1 )
+
+    conn   = sd.open_database( database, sd.INGEST_DATABASE_MODE )
+    cursor = conn.cursor()
+    quantities = select_profile_quantities( cursor, args.quantities )
+    with Timer() as timer:
+        stations, n_point_values = generate(
+            cursor,
+            args.stations,
+            args.points,
+            quantities,
+            rng,
+        )
+        conn.commit()
+    record( timings, "ingest", timer, n_point_values )
+    conn.close()
+
+    with Timer() as timer:
+        run_script( os.path.join( source_directory, "create_indexes.py" ), database )
+    record( timings, "create_indexes", timer, 1 )
+
+    with Timer() as timer:
+        run_script(
+            os.path.join( source_directory, "create_station_summary.py" ),
+            database,
+        )
+    record( timings, "create_station_summary", timer, 1 )
+
+    conn   = sd.open_database( database, sd.READ_DATABASE_MODE )
+    cursor = conn.cursor()
+
+    with Timer() as timer:
+        violations = sd.check_foreign_keys( cursor )
+    record( timings, "check_foreign_keys", timer, 1 )
+    if ( len(violations) != 0 ):
+        print( "The synthetic database violates its foreign keys.", file=sys.stderr )
+        sys.exit(1)
+
+    with Timer() as timer:
+        for station in stations:
+            sd.get_twin_profiles(
+                cursor,
+                station,
+                sd.Q_DISTANCE_FROM_WALL,
+                sd.Q_STREAMWISE_VELOCITY,
+            )
+    record( timings, "get_twin_profiles", timer, len(stations) )
+
+    with Timer() as timer:
+        for station in stations:
+            sd.load_station( cursor, station )
+    record( timings, "load_station", timer, len(stations) )
+
+    # The first lookups fill the labeled point cache, and the second ones use
+    # it.
+    for name in [ "get_labeled_value", "get_labeled_value_cached", ]:
+        with Timer() as timer:
+            for station in stations:
+                sd.get_labeled_value(
+                    cursor,
+                    station,
+                    sd.Q_FANNING_FRICTION_FACTOR,
+                    sd.WALL_POINT_LABEL,
+                    averaging_system=sd.UNWEIGHTED_AVERAGING_SYSTEM,
+                )
+        record( timings, name, timer, len(stations) )
+
+    with Timer() as timer:
+        selected_stations = query_duct_flow_stations( cursor )
+    record( timings, "duct_flow_station_query", timer, 1 )
+
+    with Timer() as timer:
+        query_duct_flow_stations( cursor, summary=True )
+    record( timings, "duct_flow_station_query_summary", timer, 1 )
+
+    with Timer() as timer:
+        sd.load_station_values(
+            cursor,
+            selected_stations,
+            [ sd.Q_BULK_REYNOLDS_NUMBER, ],
+            averaging_system=sd.UNWEIGHTED_AVERAGING_SYSTEM,
+        )
+        sd.load_labeled_values(
+            cursor,
+            selected_stations,
+            [ sd.Q_FANNING_FRICTION_FACTOR, ],
+            sd.WALL_POINT_LABEL,
+            averaging_system=sd.UNWEIGHTED_AVERAGING_SYSTEM,
+        )
+    record( timings, "duct_flow_values", timer, len(selected_stations) )
+
+    conn.close()
+
+    results = {
+        "parameters": {
+            "stations":   args.stations,
+            "points":     args.points,
+            "quantities": len(quantities),
+            "seed":       args.seed,
+        },
+        "environment": {
+            "python":  platform.python_version(),
+            "numpy":   np.__version__,
+            "sqlite":  sqlite3.sqlite_version,
+            "machine": platform.machine(),
+        },
+        "database_size": os.path.getsize( database ),
+        "selected_stations": len(selected_stations),
+        "timings": timings,
+    }
+
+    if ( args.output == None ):
+        json.dump( results, sys.stdout, indent=4, sort_keys=True )
+        print()
+    else:
+        with open( args.output, "w" ) as output_file:
+            json.dump( results, output_file, indent=4, sort_keys=True )
+            output_file.write( "\n" )
+
+    if ( temporary_directory != None ):
+        temporary_directory.cleanup()
+
+if ( __name__ == "__main__" ):
+    main()
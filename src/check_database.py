@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import sheardata as sd
+import sys
+
+# Checks the foreign keys of the database (the first argument) after all of
+# the studies are inserted, since the preprocessing scripts insert the data
+# without enforcing them.  Any violations are reported study by study, and
+# the script then fails so that the build stops.
+
+conn   = sd.open_database( sys.argv[1], sd.READ_DATABASE_MODE )
+cursor = conn.cursor()
+
+violations = sd.check_foreign_keys( cursor )
+
+conn.close()
+
+for study in sorted( violations, key=lambda study: ( study == None, str(study) ) ):
+    if ( study == None ):
+        heading = "Rows outside of any study"
+    else:
+        heading = "Study {:s}".format( study )
+    print(
+        "{:s}: {:d} foreign key violation(s)".format(
+            heading,
+            len(violations[study]),
+        ),
+        file=sys.stderr,
+    )
+    for table, key, parent in violations[study]:
+        print(
+            "    table {:s}, row {:s}, referring to table {:s}".format(
+                table,
+                str(key),
+                parent,
+            ),
+            file=sys.stderr,
+        )
+
+if ( len(violations) != 0 ):
+    sys.exit(1)
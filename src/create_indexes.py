@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import sheardata as sd
+import sys
+
+# The secondary indexes are created after all of the data is inserted, since
+# building an index once is faster than updating it for every insert.
+
+conn   = sd.open_database( sys.argv[1], sd.INGEST_DATABASE_MODE )
+cursor = conn.cursor()
+
+# Stations by series and by study
+cursor.execute(
+"""
+CREATE INDEX IF NOT EXISTS stations_by_series
+ON stations( series );
+"""
+)
+
+cursor.execute(
+"""
+CREATE INDEX IF NOT EXISTS stations_by_study
+ON stations( study );
+"""
+)
+
+# Labeled points
+cursor.execute(
+"""
+CREATE INDEX IF NOT EXISTS points_by_label
+ON points( point_label, station );
+"""
+)
+
+# Station values by quantity
+#
+# These indexes cover the queries that select stations by the range of a
+# particular quantity, so these queries never need to read the table itself.
+cursor.execute(
+"""
+CREATE INDEX IF NOT EXISTS station_values_by_quantity
+ON station_values( quantity, outlier, station_value, station );
+"""
+)
+
+# Point values by quantity
+cursor.execute(
+"""
+CREATE INDEX IF NOT EXISTS point_values_by_quantity
+ON point_values( quantity, outlier, point_value, point );
+"""
+)
+
+# Gather statistics so that the query planner can choose between the indexes.
+cursor.execute( "ANALYZE;" )
+
+conn.commit()
+conn.close()
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import sheardata as sd
+import sys
+
+# Recreates the station summary after all of the data is inserted, since it is
+# derived from the other tables.
+
+conn   = sd.open_database( sys.argv[1], sd.INGEST_DATABASE_MODE )
+cursor = conn.cursor()
+
+sd.create_station_summary( cursor )
+
+conn.commit()
+conn.close()
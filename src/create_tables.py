@@ -5,13 +5,11 @@
 # SPDX-License-Identifier: MIT
 
 import csv
-import sqlite3
 import sheardata as sd
 import sys
 
-conn = sqlite3.connect( sys.argv[1] )
-cursor =  conn.cursor()
-cursor.execute( "PRAGMA foreign_keys = ON;" )
+conn   = sd.open_database( sys.argv[1], sd.INGEST_DATABASE_MODE )
+cursor = conn.cursor()
 
 # Averaging systems
 cursor.execute(
@@ -713,6 +711,58 @@ CREATE TABLE points (
 """
 )
 
+# Study inputs
+#
+# A hash of the inputs used to create each study (its preprocessing script and
+# the files in its data directory).  The build only deletes and reinserts a
+# study when this hash changes.
+cursor.execute(
+"""
+CREATE TABLE study_inputs (
+    study      TEXT PRIMARY KEY UNIQUE,
+    input_hash TEXT NOT NULL,
+    FOREIGN KEY(study) REFERENCES studies(identifier)
+);
+"""
+)
+
+# Ingest statistics
+#
+# The time, number of statement executions, total number of rows inserted, and
+# increase in the peak memory use (in bytes) of the process for each study, and
+# the number of rows inserted in each table for each study.  These are only
+# recorded when the SHEARDATA_INGEST_STATS environment variable is set.
+#
+# The statement executions are counted by the trace callback of the
+# connection, which runs each time SQLite starts executing a statement.  This
+# counts an executemany once for every row rather than once, and it includes
+# the BEGIN and COMMIT statements issued implicitly by the sqlite3 module, so
+# it is not the number of distinct statements or of calls to execute.
+cursor.execute(
+"""
+CREATE TABLE ingest_stats (
+    study                TEXT PRIMARY KEY UNIQUE,
+    elapsed_time         REAL NOT NULL CHECK ( elapsed_time >= 0.0 ),
+    statement_executions INTEGER NOT NULL CHECK ( statement_executions >= 0 ),
+    rows_inserted        INTEGER NOT NULL CHECK ( rows_inserted >= 0 ),
+    peak_memory_increase INTEGER DEFAULT NULL CHECK ( peak_memory_increase >= 0 ),
+    FOREIGN KEY(study) REFERENCES studies(identifier)
+);
+"""
+)
+
+cursor.execute(
+"""
+CREATE TABLE ingest_table_stats (
+    study         TEXT NOT NULL,
+    table_name    TEXT NOT NULL,
+    rows_inserted INTEGER NOT NULL CHECK ( rows_inserted > 0 ),
+    PRIMARY KEY(study, table_name),
+    FOREIGN KEY(study) REFERENCES studies(identifier)
+);
+"""
+)
+
 # Sources (literature references)
 #
 # The classification refers to whether this source (reference) is a primary
@@ -898,6 +948,15 @@ CREATE TABLE point_values_mt (
 """
 )
 
+# Notes for studies, series, stations, and points
+#
+# These tables are WITHOUT ROWID tables, so each is stored as a single B-tree
+# ordered by its primary key rather than as a table plus a separate index on
+# the primary key that repeats every identifier.  The columns of the primary
+# key cannot be NULL in such a table.  That rules out the value, measurement
+# technique, and value note tables, since values without an averaging system
+# have a NULL averaging system.
+
 # Notes for studies
 cursor.execute(
 """
@@ -907,7 +966,7 @@ CREATE TABLE study_notes (
     PRIMARY KEY(study, note),
     FOREIGN KEY(study) REFERENCES studies(identifier),
     FOREIGN KEY(note)  REFERENCES   notes(note_id)
-);
+) WITHOUT ROWID;
 """
 )
 
@@ -938,7 +997,7 @@ CREATE TABLE series_notes (
     PRIMARY KEY(series, note),
     FOREIGN KEY(series) REFERENCES series(identifier),
     FOREIGN KEY(note)   REFERENCES  notes(note_id)
-);
+) WITHOUT ROWID;
 """
 )
 
@@ -969,7 +1028,7 @@ CREATE TABLE station_notes (
     PRIMARY KEY(station, note),
     FOREIGN KEY(station) REFERENCES stations(identifier),
     FOREIGN KEY(note)    REFERENCES    notes(note_id)
-);
+) WITHOUT ROWID;
 """
 )
 
@@ -1000,7 +1059,7 @@ CREATE TABLE point_notes (
     PRIMARY KEY(point, note),
     FOREIGN KEY(point) REFERENCES points(identifier),
     FOREIGN KEY(note)  REFERENCES  notes(note_id)
-);
+) WITHOUT ROWID;
 """
 )
 
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import sheardata as sd
+import sys
+import time
+
+# Runs every preprocessing script (the remaining arguments) on the database
+# (the first argument) in one process using one connection, rather than
+# starting a new interpreter and opening the database again for each study.
+# The studies do not depend on each other, so they run in order of their
+# identifiers.  Each study is inserted in its own transaction, and only
+# studies whose inputs changed are inserted again, as in ingest_study.py.
+
+conn   = sd.open_database( sys.argv[1], sd.INGEST_DATABASE_MODE )
+cursor = conn.cursor()
+
+scripts = sorted( sys.argv[2:], key=sd.study_of_ingest_script )
+
+total_time = 0.0
+for script in scripts:
+    start_time = time.perf_counter()
+    inserted   = sd.ingest_study( cursor, script )
+    conn.commit()
+    elapsed_time = time.perf_counter() - start_time
+    total_time  += elapsed_time
+    if ( inserted ):
+        print(
+            "{:s}: inserted in {:.3f} s".format(
+                sd.study_of_ingest_script( script ),
+                elapsed_time,
+            )
+        )
+
+print( "{:d} studies checked in {:.3f} s".format( len(scripts), total_time ) )
+
+if ( os.environ.get( sd.INGEST_STATS_ENVIRONMENT_VARIABLE, "" ) != "" ):
+    sd.print_ingest_stats( cursor )
+
+conn.close()
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import sheardata as sd
+import sys
+
+# Runs a preprocessing script (the second argument) on the database (the first
+# argument), but only when the inputs for its study have changed since the
+# study was last inserted.  The inputs are the script itself and the files in
+# the data directory for the study.  Any existing copy of the study is deleted
+# first, so a study can be reinserted without rebuilding the whole database.
+
+conn   = sd.open_database( sys.argv[1], sd.INGEST_DATABASE_MODE )
+cursor = conn.cursor()
+
+sd.ingest_study( cursor, sys.argv[2] )
+
+conn.commit()
+conn.close()
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import sheardata as sd
+import sys
+
+# Merges the staging databases (the remaining arguments), each created by
+# running one preprocessing script on a copy of the empty database, into the
+# database (the first argument).  The foreign keys are not enforced while
+# merging; check_database.py checks them once afterwards.
+
+conn   = sd.open_database( sys.argv[1], sd.INGEST_DATABASE_MODE )
+cursor = conn.cursor()
+
+for filename in sys.argv[2:]:
+    sd.merge_database( cursor, filename )
+
+conn.commit()
+conn.close()
@@ -5,12 +5,10 @@
 # SPDX-License-Identifier: MIT
 
 import sheardata as sd
-import sqlite3
 import sys
 
-conn   = sqlite3.connect( sys.argv[1] )
+conn   = sd.open_database( sys.argv[1], sd.READ_DATABASE_MODE )
 cursor = conn.cursor()
-cursor.execute( "PRAGMA foreign_keys = ON;" )
 
 with open( "list-flow-classes.tex.tmp", "w" ) as f:
     f.write( r"\begin{itemize}"+"\n" )
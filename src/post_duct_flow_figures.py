@@ -5,11 +5,8 @@
 # SPDX-License-Identifier: MIT
 
 import sheardata as sd
-import sqlite3
 import sys
 import numpy as np
-from uncertainties import ufloat
-from uncertainties import unumpy as unp
 
 import matplotlib as mpl
 mpl.use("pgf")
@@ -17,9 +14,8 @@ import matplotlib.pylab as plt
 import gfx
 mpl.rcParams.update( gfx.rc_custom_preamble() )
 
-conn   = sqlite3.connect( sys.argv[1] )
+conn   = sd.open_database( sys.argv[1], sd.READ_DATABASE_MODE )
 cursor = conn.cursor()
-cursor.execute( "PRAGMA foreign_keys = ON;" )
 
 # Intersection of
 # - Stations in duct flow experimental studies
@@ -118,213 +114,71 @@ for duct_type in duct_types:
 
         for study_type in [ sd.DIRECT_NUMERICAL_SIMULATION_STUDY_TYPE,
                                            sd.EXPERIMENTAL_STUDY_TYPE, ]:
+            station_query = sd.StationQuery( summary=True )
+            station_query.flow_class( sd.DUCT_FLOW_CLASS )
+            station_query.study_type( study_type )
+            station_query.number_of_dimensions( 2 )
+            station_query.coordinate_system( duct_types[duct_type].coordinate_system )
+            station_query.geometry( duct_types[duct_type].geometry )
+            station_query.fully_developed()
+            station_query.point_value(
+                sd.Q_INNER_LAYER_ROUGHNESS_HEIGHT,
+                maximum=max_inner_layer_roughness_height,
+                include_maximum=False,
+            )
+            station_query.station_value(
+                sd.Q_ASPECT_RATIO,
+                duct_types[duct_type].min_aspect_ratio,
+                duct_types[duct_type].max_aspect_ratio,
+            )
+            station_query.station_value(
+                sd.Q_BULK_MACH_NUMBER,
+                min_bulk_mach_number,
+                max_bulk_mach_number,
+                include_maximum=False,
+            )
+            station_query.station_value(
+                sd.Q_OUTER_LAYER_DEVELOPMENT_LENGTH,
+                minimum=min_outer_layer_development_length,
+            )
+            station_query.labeled_value(
+                sd.WALL_POINT_LABEL,
+                sd.Q_CENTER_LINE_TO_WALL_TEMPERATURE_RATIO,
+                min_center_line_to_wall_temperature_ratio,
+                max_center_line_to_wall_temperature_ratio,
+            )
+            station_query.station_value( sd.Q_BULK_REYNOLDS_NUMBER )
+
             if ( quantity == sd.Q_BULK_TO_CENTER_LINE_VELOCITY_RATIO ):
-                cursor.execute(
-                """
-                SELECT identifier
-                FROM stations
-                WHERE study IN (
-                    SELECT identifier
-                    FROM studies
-                    WHERE flow_class=? AND study_type=?
-                )
-                INTERSECT
-                SELECT identifier
-                FROM stations
-                WHERE series IN (
-                    SELECT identifier
-                    FROM series
-                    WHERE number_of_dimensions=? AND coordinate_system=? AND geometry=?
-                )
-                INTERSECT
-                SELECT identifier
-                FROM stations
-                WHERE previous_streamwise_station=next_streamwise_station
-                INTERSECT
-                SELECT station
-                FROM points
-                WHERE identifier IN (
-                    SELECT point
-                    FROM point_values
-                    WHERE quantity=? AND point_value<? AND outlier=0
-                )
-                INTERSECT
-                SELECT station
-                FROM station_values
-                WHERE quantity=? AND station_value>=? AND station_value<=? AND outlier=0
-                INTERSECT
-                SELECT station
-                FROM station_values
-                WHERE quantity=? AND station_value>=? AND station_value<? AND outlier=0
-                INTERSECT
-                SELECT station
-                FROM station_values
-                WHERE quantity=? AND station_value>=? AND outlier=0
-                INTERSECT
-                SELECT station
-                FROM points
-                WHERE point_label=? AND identifier IN (
-                    SELECT point
-                    FROM point_values
-                    WHERE quantity=? AND point_value>=? AND point_value<=? AND outlier=0
-                )
-                INTERSECT
-                SELECT station
-                FROM station_values
-                WHERE quantity=? AND outlier=0
-                INTERSECT
-                SELECT station
-                FROM station_values
-                WHERE quantity=? AND outlier=0
-                ORDER BY identifier;
-                """,
-                (
-                    sd.DUCT_FLOW_CLASS,
-                    study_type,
-                    int(2),
-                    duct_types[duct_type].coordinate_system,
-                    duct_types[duct_type].geometry,
-                    sd.Q_INNER_LAYER_ROUGHNESS_HEIGHT,
-                    max_inner_layer_roughness_height,
-                    sd.Q_ASPECT_RATIO,
-                    duct_types[duct_type].min_aspect_ratio,
-                    duct_types[duct_type].max_aspect_ratio,
-                    sd.Q_BULK_MACH_NUMBER,
-                    min_bulk_mach_number,
-                    max_bulk_mach_number,
-                    sd.Q_OUTER_LAYER_DEVELOPMENT_LENGTH,
-                    min_outer_layer_development_length,
-                    sd.WALL_POINT_LABEL,
-                    sd.Q_CENTER_LINE_TO_WALL_TEMPERATURE_RATIO,
-                    min_center_line_to_wall_temperature_ratio,
-                    max_center_line_to_wall_temperature_ratio,
-                    sd.Q_BULK_REYNOLDS_NUMBER,
-                    quantity,
-                )
-                )
+                station_query.station_value( quantity )
             elif ( quantity == sd.Q_FANNING_FRICTION_FACTOR ):
-                cursor.execute(
-                """
-                SELECT identifier
-                FROM stations
-                WHERE study IN (
-                    SELECT identifier
-                    FROM studies
-                    WHERE flow_class=? AND study_type=?
-                )
-                INTERSECT
-                SELECT identifier
-                FROM stations
-                WHERE series IN (
-                    SELECT identifier
-                    FROM series
-                    WHERE number_of_dimensions=? AND coordinate_system=? AND geometry=?
-                )
-                INTERSECT
-                SELECT identifier
-                FROM stations
-                WHERE previous_streamwise_station=next_streamwise_station
-                INTERSECT
-                SELECT station
-                FROM points
-                WHERE identifier IN (
-                    SELECT point
-                    FROM point_values
-                    WHERE quantity=? AND point_value<? AND outlier=0
-                )
-                INTERSECT
-                SELECT station
-                FROM station_values
-                WHERE quantity=? AND station_value>=? AND station_value<=? AND outlier=0
-                INTERSECT
-                SELECT station
-                FROM station_values
-                WHERE quantity=? AND station_value>=? AND station_value<? AND outlier=0
-                INTERSECT
-                SELECT station
-                FROM station_values
-                WHERE quantity=? AND station_value>=? AND outlier=0
-                INTERSECT
-                SELECT station
-                FROM points
-                WHERE point_label=? AND identifier IN (
-                    SELECT point
-                    FROM point_values
-                    WHERE quantity=? AND point_value>=? AND point_value<=? AND outlier=0
-                )
-                INTERSECT
-                SELECT station
-                FROM station_values
-                WHERE quantity=? AND outlier=0
-                INTERSECT
-                SELECT station
-                FROM points
-                WHERE point_label=? AND identifier IN (
-                    SELECT point
-                    FROM point_values
-                    WHERE quantity=? AND outlier=0
-                )
-                ORDER BY identifier;
-                """,
-                (
-                    sd.DUCT_FLOW_CLASS,
-                    study_type,
-                    int(2),
-                    duct_types[duct_type].coordinate_system,
-                    duct_types[duct_type].geometry,
-                    sd.Q_INNER_LAYER_ROUGHNESS_HEIGHT,
-                    max_inner_layer_roughness_height,
-                    sd.Q_ASPECT_RATIO,
-                    duct_types[duct_type].min_aspect_ratio,
-                    duct_types[duct_type].max_aspect_ratio,
-                    sd.Q_BULK_MACH_NUMBER,
-                    min_bulk_mach_number,
-                    max_bulk_mach_number,
-                    sd.Q_OUTER_LAYER_DEVELOPMENT_LENGTH,
-                    min_outer_layer_development_length,
-                    sd.WALL_POINT_LABEL,
-                    sd.Q_CENTER_LINE_TO_WALL_TEMPERATURE_RATIO,
-                    min_center_line_to_wall_temperature_ratio,
-                    max_center_line_to_wall_temperature_ratio,
-                    sd.Q_BULK_REYNOLDS_NUMBER,
-                    sd.WALL_POINT_LABEL,
-                    quantity,
-                )
-                )
-
-            stations = []
-            for result in cursor.fetchall():
-                stations.append( str(result[0]) )
-                all_stations.append( str(result[0]) )
-
-            bulk_reynolds_number_array = []
-            quantity_values_array      = []
-            for station in stations:
-                bulk_reynolds_number_array.append( sd.get_station_value(
+                station_query.labeled_value( sd.WALL_POINT_LABEL, quantity )
+
+            stations = station_query.fetch( cursor )
+            all_stations.extend( stations )
+
+            bulk_reynolds_number = sd.load_station_values(
+                cursor,
+                stations,
+                [ sd.Q_BULK_REYNOLDS_NUMBER, ],
+                averaging_system=sd.UNWEIGHTED_AVERAGING_SYSTEM,
+            )[sd.Q_BULK_REYNOLDS_NUMBER]
+
+            if ( quantity == sd.Q_BULK_TO_CENTER_LINE_VELOCITY_RATIO ):
+                quantity_values = sd.load_station_values(
                     cursor,
-                    station,
-                    sd.Q_BULK_REYNOLDS_NUMBER,
+                    stations,
+                    [ quantity, ],
                     averaging_system=sd.UNWEIGHTED_AVERAGING_SYSTEM,
-                ) )
-
-                if ( quantity == sd.Q_BULK_TO_CENTER_LINE_VELOCITY_RATIO ):
-                    quantity_values_array.append( sd.get_station_value(
-                        cursor,
-                        station,
-                        quantity,
-                        averaging_system=sd.UNWEIGHTED_AVERAGING_SYSTEM,
-                    ) )
-                elif ( quantity == sd.Q_FANNING_FRICTION_FACTOR ):
-                    quantity_values_array.append( sd.get_labeled_value(
-                        cursor,
-                        station,
-                        quantity,
-                        sd.WALL_POINT_LABEL,
-                        averaging_system=sd.UNWEIGHTED_AVERAGING_SYSTEM,
-                    ) )
-
-            bulk_reynolds_number = np.array( bulk_reynolds_number_array )
-            quantity_values      = np.array(      quantity_values_array )
+                )[quantity]
+            elif ( quantity == sd.Q_FANNING_FRICTION_FACTOR ):
+                quantity_values = sd.load_labeled_values(
+                    cursor,
+                    stations,
+                    [ quantity, ],
+                    sd.WALL_POINT_LABEL,
+                    averaging_system=sd.UNWEIGHTED_AVERAGING_SYSTEM,
+                )[quantity]
 
             study_order = 2
             marker_type = "o"
@@ -333,9 +187,9 @@ for duct_type in duct_types:
                 study_order = 3
 
             ax.errorbar(
-                unp.nominal_values( bulk_reynolds_number  ),
-                unp.nominal_values( quantity_values ),
-                unp.std_devs( quantity_values ),
+                bulk_reynolds_number.nominal,
+                quantity_values.nominal,
+                quantity_values.std_dev,
                 marker=marker_type,
                 linestyle="",
                 elinewidth=gfx.error_bar_width,
@@ -4,12 +4,11 @@
 #
 # SPDX-License-Identifier: MIT
 
-import sqlite3
+import sheardata as sd
 import sys
 
-conn   = sqlite3.connect( sys.argv[1] )
+conn   = sd.open_database( sys.argv[1], sd.READ_DATABASE_MODE )
 cursor = conn.cursor()
-cursor.execute( "PRAGMA foreign_keys = ON;" )
 
 with open( "figure-flow-classification-tree-diagram.gv", "w" ) as f:
     f.write( 'digraph taxonomy {\n' )
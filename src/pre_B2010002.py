@@ -6,27 +6,27 @@
 
 import csv
 import math
-import sqlite3
 import sheardata as sd
 import sys
 
-conn   = sqlite3.connect( sys.argv[1] )
-cursor = conn.cursor()
-cursor.execute( "PRAGMA foreign_keys = ON;" )
+def ingest( cursor ):
+    flow_class   = sd.BOUNDARY_LAYER_FLOW_CLASS
+    year         = 2010
+    study_number = 2
 
-flow_class   = sd.BOUNDARY_LAYER_FLOW_CLASS
-year         = 2010
-study_number = 2
+    study_identifier = sd.add_study(
+        cursor,
+        flow_class=flow_class,
+        year=year,
+        study_number=study_number,
+        study_type=sd.DIRECT_NUMERICAL_SIMULATION_STUDY_TYPE,
+    )
 
-study_identifier = sd.add_study(
-    cursor,
-    flow_class=flow_class,
-    year=year,
-    study_number=study_number,
-    study_type=sd.DIRECT_NUMERICAL_SIMULATION_STUDY_TYPE,
-)
+    sd.add_source( cursor, study_identifier, "SchlatterP+2010+eng+JOUR",  1 )
 
-sd.add_source( cursor, study_identifier, "SchlatterP+2010+eng+JOUR",  1 )
-
-conn.commit()
-conn.close()
+if ( __name__ == "__main__" ):
+    conn   = sd.open_database( sys.argv[1], sd.INGEST_DATABASE_MODE )
+    cursor = conn.cursor()
+    ingest( cursor )
+    conn.commit()
+    conn.close()
@@ -4,170 +4,159 @@
 #
 # SPDX-License-Identifier: MIT
 
-import csv
 import math
-import sqlite3
 import sheardata as sd
 import sys
 
-conn   = sqlite3.connect( sys.argv[1] )
-cursor = conn.cursor()
-cursor.execute( "PRAGMA foreign_keys = ON;" )
-
-flow_class    = sd.DUCT_FLOW_CLASS
-year          = 1914
-study_number  = 1
-
-study_identifier = sd.add_study(
-    cursor,
-    flow_class=flow_class,
-    year=year,
-    study_number=study_number,
-    study_type=sd.EXPERIMENTAL_STUDY_TYPE,
-)
+def ingest( cursor ):
+    flow_class    = sd.DUCT_FLOW_CLASS
+    year          = 1914
+    study_number  = 1
+
+    study_identifier = sd.add_study(
+        cursor,
+        flow_class=flow_class,
+        year=year,
+        study_number=study_number,
+        study_type=sd.EXPERIMENTAL_STUDY_TYPE,
+    )
 
-sd.add_source( cursor, study_identifier, "StantonTE+1914+eng+JOUR", 1 )
-sd.add_source( cursor, study_identifier, "ObotNT+1988+eng+JOUR",    2 )
+    sd.add_source( cursor, study_identifier, "StantonTE+1914+eng+JOUR", 1 )
+    sd.add_source( cursor, study_identifier, "ObotNT+1988+eng+JOUR",    2 )
 
-development_length_note = sd.add_note(
-    cursor,
-    "../data/{:s}/note_development_length.tex".format( study_identifier ),
-)
+    development_length_note = sd.add_note(
+        cursor,
+        "../data/{:s}/note_development_length.tex".format( study_identifier ),
+    )
 
-mass_density_note = sd.add_note(
-    cursor,
-    "../data/{:s}/note_mass_density.tex".format( study_identifier ),
-)
+    mass_density_note = sd.add_note(
+        cursor,
+        "../data/{:s}/note_mass_density.tex".format( study_identifier ),
+    )
 
-class Pipe:
-    diameter                       = None
-    distance_between_pressure_taps = None
-    material                       = None
+    class Pipe:
+        diameter                       = None
+        distance_between_pressure_taps = None
+        material                       = None
 
+        # p. 202
+        #
+        # \begin{quote}
+        # The length of ``leading in'' pipe, of the same diameter as the
+        # experimental portion, through which the fluid passed before any
+        # observations of its velocity or pressure were made, varied from 90 to 140
+        # diameters, as it was considered that this length was sufficient both to
+        # enable any irregularities in the distribution of velocity to die away, or
+        # any stream-line motion at the inlet to break up, before the measurements
+        # were taken.
+        # \end{quote}
+        #
+        # For the sake of simplicity, assume that the development length is the
+        # minimum of these.  It is long enough that its precise value does not
+        # matter.
+        def outer_layer_development_length( self ):
+            return sd.sdfloat(90.0)
+
+        def development_length( self ):
+            return diameter * self.outer_layer_development_length()
+
+        def __init__( self, diameter, distance_between_pressure_taps, material ):
+            self.diameter = sd.sdfloat(diameter)
+            if ( distance_between_pressure_taps == 0.0 ):
+                self.distance_between_pressure_taps = None
+            else:
+                self.distance_between_pressure_taps = distance_between_pressure_taps
+            self.material = str(material)
+
+    # Pipe 12A
+    #
     # p. 202
     #
     # \begin{quote}
-    # The length of ``leading in'' pipe, of the same diameter as the
-    # experimental portion, through which the fluid passed before any
-    # observations of its velocity or pressure were made, varied from 90 to 140
-    # diameters, as it was considered that this length was sufficient both to
-    # enable any irregularities in the distribution of velocity to die away, or
-    # any stream-line motion at the inlet to break up, before the measurements
-    # were taken.
+    # For very accurate comparison the surfaces of the tubes should have been
+    # precisely geometrically similar, as regards roughness, but as this condition
+    # could not be fulfilled, the experiments were all made on commercially
+    # smooth-drawn brass pipes.
     # \end{quote}
     #
-    # For the sake of simplicity, assume that the development length is the
-    # minimum of these.  It is long enough that its precise value does not
-    # matter.
-    def outer_layer_development_length( self ):
-        return sd.sdfloat(90.0)
-
-    def development_length( self ):
-        return diameter * self.outer_layer_development_length()
-
-    def __init__( self, diameter, distance_between_pressure_taps, material ):
-        self.diameter = sd.sdfloat(diameter)
-        if ( distance_between_pressure_taps == 0.0 ):
-            self.distance_between_pressure_taps = None
-        else:
-            self.distance_between_pressure_taps = distance_between_pressure_taps
-        self.material = str(material)
-
-# Pipe 12A
-#
-# p. 202
-#
-# \begin{quote}
-# For very accurate comparison the surfaces of the tubes should have been
-# precisely geometrically similar, as regards roughness, but as this condition
-# could not be fulfilled, the experiments were all made on commercially
-# smooth-drawn brass pipes.
-# \end{quote}
-#
-# However, this only appears to be the case for most of the experiments.  Some
-# were conducted using steel pipes.  One experiment using air and all of the
-# experiments with thick oil are using steel pipes.
-#
-# p. 209
-#
-# \begin{quote}
-# As a matter of interest the results of a series of observations of the
-# surface fraction of this oil, when flowing through a steel pipe 10.1 cm.
-# diameter at speeds varying from 5 to 60 cm. per second, are given in Table
-# IV. and are also plotted in fig. 3.
-# \end{quote}
-#
-# Pipe 12A on p. 224 is not in the table on p. 207.  It is possible that this
-# pipe is a brass pipe, but unfortunately the test length is not specified.
-
-pipes = {}
-pipes_filename = "../data/{:s}/pipes.csv".format( study_identifier )
-with open( pipes_filename, "r" ) as pipes_file:
-    pipes_reader = csv.reader(
-        pipes_file,
-        delimiter=",",
-        quotechar='"', \
-        skipinitialspace=True,
+    # However, this only appears to be the case for most of the experiments.  Some
+    # were conducted using steel pipes.  One experiment using air and all of the
+    # experiments with thick oil are using steel pipes.
+    #
+    # p. 209
+    #
+    # \begin{quote}
+    # As a matter of interest the results of a series of observations of the
+    # surface fraction of this oil, when flowing through a steel pipe 10.1 cm.
+    # diameter at speeds varying from 5 to 60 cm. per second, are given in Table
+    # IV. and are also plotted in fig. 3.
+    # \end{quote}
+    #
+    # Pipe 12A on p. 224 is not in the table on p. 207.  It is possible that this
+    # pipe is a brass pipe, but unfortunately the test length is not specified.
+
+    pipes = {}
+    pipes_filename = "../data/{:s}/pipes.csv".format( study_identifier )
+    pipe_names, diameters, lengths, materials = sd.read_profile_file(
+        pipes_filename,
+        [
+            sd.ProfileColumn( "Identifier", transform=str, ),
+            sd.ProfileColumn( "Diameter",   scale=1.0e-2,  ),
+            sd.ProfileColumn( "Length",     scale=1.0e-2,  ),
+            sd.ProfileColumn( "Material",   transform=str, ),
+        ],
     )
-    next(pipes_reader)
-    for pipes_row in pipes_reader:
-        pipes[str(pipes_row[0])] = Pipe(
-            float(pipes_row[1]) * 1.0e-2,
-            float(pipes_row[2]) * 1.0e-2,
-              str(pipes_row[3]),
-        )
+    for pipe, diameter, length, material in zip( pipe_names, diameters.nominal, \
+                                                 lengths.nominal, materials ):
+        pipes[pipe] = Pipe( diameter, length, material )
 
-# p. 203
-#
-# \begin{quote}
-# The form of the tilting manometer used for the estimation of both the surface
-# friction and the axial velocity, is that devised by Dr. A. P.  Chattock and
-# has been previously described.†  For the purpose of the present paper it is
-# sufficient to state that in this manometer a pressure difference of the order
-# of 0.003 mm. of water can be detected, which is well within the limits of
-# sensitivity required in these experiments.  As the fall of pressure in these
-# pipes varied from 0.5 to 150,000 mm. of water, other manometers were required
-# for the higher pressures, and for this purpose water or mercury U-tubes were
-# used for the intermediate pressures, and the Bourdon pressure gauges for the
-# highest pressures.
-# \end{quote}
-#
-# The footnote lists two papers that should contain more information about the
-# manometers used.
-#
-# This appears to be the only information given about the uncertainty of the
-# experiments.  It is less useful than it appears, since according to the table
-# on page 207, different manometers and gauges were used seemingly at random,
-# making it unclear where the cutoff for "higher pressures" really is.
-#
-# Moreover, just as in the 1911 case, the uncertainties produced after
-# propagating this from the pressure measurements to the velocities and shear
-# stresses are many orders of magnitude too small.  Therefore it is difficult
-# to estimate the uncertainties of these measurements.
-
-# Set 1: velocity ratio data
-series_number = 0
-ratio_filename = "../data/{:s}/bulk_and_maximum_velocities.csv".format( study_identifier )
-with open( ratio_filename, "r" ) as ratio_file:
-    ratio_reader = csv.reader(
-        ratio_file,
-        delimiter=",",
-        quotechar='"', \
-        skipinitialspace=True,
+    # p. 203
+    #
+    # \begin{quote}
+    # The form of the tilting manometer used for the estimation of both the surface
+    # friction and the axial velocity, is that devised by Dr. A. P.  Chattock and
+    # has been previously described.†  For the purpose of the present paper it is
+    # sufficient to state that in this manometer a pressure difference of the order
+    # of 0.003 mm. of water can be detected, which is well within the limits of
+    # sensitivity required in these experiments.  As the fall of pressure in these
+    # pipes varied from 0.5 to 150,000 mm. of water, other manometers were required
+    # for the higher pressures, and for this purpose water or mercury U-tubes were
+    # used for the intermediate pressures, and the Bourdon pressure gauges for the
+    # highest pressures.
+    # \end{quote}
+    #
+    # The footnote lists two papers that should contain more information about the
+    # manometers used.
+    #
+    # This appears to be the only information given about the uncertainty of the
+    # experiments.  It is less useful than it appears, since according to the table
+    # on page 207, different manometers and gauges were used seemingly at random,
+    # making it unclear where the cutoff for "higher pressures" really is.
+    #
+    # Moreover, just as in the 1911 case, the uncertainties produced after
+    # propagating this from the pressure measurements to the velocities and shear
+    # stresses are many orders of magnitude too small.  Therefore it is difficult
+    # to estimate the uncertainties of these measurements.
+
+    # Set 1: velocity ratio data
+    series_number = 0
+    ratio_filename = "../data/{:s}/bulk_and_maximum_velocities.csv".format( study_identifier )
+    ratios = sd.read_profile_file(
+        ratio_filename,
+        [
+            sd.ProfileColumn( "Bulk velocity",    scale=1.0e-2,  ),
+            sd.ProfileColumn( "Maximum velocity", scale=1.0e-2,  ),
+            sd.ProfileColumn( "Working fluid",    transform=str, ),
+            sd.ProfileColumn( "Pipe",             transform=str, ),
+        ],
     )
-    next(ratio_reader)
-    for ratio_row in ratio_reader:
+    for bulk_velocity, maximum_velocity, working_fluid, pipe in zip( *ratios ):
         series_number += 1
 
         # Series 49, the one with the bulk velocity of 115.5 cm/s, appears to
         # be a turbulent value at a laminar Reynolds number.
         outlier = True if series_number == 49 else False
 
-        bulk_velocity    = sd.sdfloat(ratio_row[0]) * 1.0e-2
-        maximum_velocity = sd.sdfloat(ratio_row[1]) * 1.0e-2
-        working_fluid    =        str(ratio_row[2])
-        pipe             =        str(ratio_row[3])
-
         diameter                       = pipes[pipe].diameter
         distance_between_pressure_taps = pipes[pipe].distance_between_pressure_taps
         development_length             = pipes[pipe].development_length()
@@ -332,27 +321,24 @@ with open( ratio_filename, "r" ) as ratio_file:
         sd.set_labeled_value( cursor, station_identifier, sd.Q_CENTER_LINE_TO_WALL_TEMPERATURE_RATIO, sd.WALL_POINT_LABEL, sd.sdfloat( 1.0, 0.0 ), averaging_system=sd.BOTH_AVERAGING_SYSTEMS, measurement_techniques=[sd.MT_ASSUMPTION], )
         sd.set_labeled_value( cursor, station_identifier, sd.Q_WALL_TO_RECOVERY_TEMPERATURE_RATIO,    sd.WALL_POINT_LABEL, sd.sdfloat( 1.0, 0.0 ), averaging_system=sd.BOTH_AVERAGING_SYSTEMS, measurement_techniques=[sd.MT_ASSUMPTION], )
 
-# Set 2: wall shear stress data
-shear_stress_filename = "../data/{:s}/wall_shear_stress_measurements.csv".format( study_identifier )
-with open( shear_stress_filename, "r" ) as shear_stress_file:
-    shear_stress_reader = csv.reader(
-        shear_stress_file,
-        delimiter=",",
-        quotechar='"', \
-        skipinitialspace=True,
+    # Set 2: wall shear stress data
+    shear_stress_filename = "../data/{:s}/wall_shear_stress_measurements.csv".format( study_identifier )
+    shear_stresses = sd.read_profile_file(
+        shear_stress_filename,
+        [
+            sd.ProfileColumn( "Bulk velocity",        scale=1.0e-2,                                          ),
+            sd.ProfileColumn( "Wall shear stress",    scale=1.0e-1,                                          ),
+            sd.ProfileColumn( "Friction coefficient", scale=2.0,                                             ),
+            sd.ProfileColumn( "Reynolds number",                                                             ),
+            sd.ProfileColumn( "Temperature",          transform=lambda cell: float(cell) + sd.ABSOLUTE_ZERO, ),
+            sd.ProfileColumn( "Working fluid",        transform=str,                                         ),
+            sd.ProfileColumn( "Pipe",                 transform=str,                                         ),
+        ],
     )
-    next(shear_stress_reader)
-    for shear_stress_row in shear_stress_reader:
+    for bulk_velocity, wall_shear_stress, fanning_friction_factor, Re_bulk, \
+        temperature, working_fluid, pipe in zip( *shear_stresses ):
         series_number += 1
 
-        bulk_velocity                 = sd.sdfloat(shear_stress_row[0]) * 1.0e-2
-        wall_shear_stress             = sd.sdfloat(shear_stress_row[1]) * 1.0e-1
-        fanning_friction_factor       = sd.sdfloat(shear_stress_row[2]) * 2.0
-        Re_bulk                       = sd.sdfloat(shear_stress_row[3])
-        temperature                   = sd.sdfloat(shear_stress_row[4]) + sd.ABSOLUTE_ZERO
-        working_fluid                 =        str(shear_stress_row[5])
-        pipe                          =        str(shear_stress_row[6])
-
         diameter                       = pipes[pipe].diameter
         distance_between_pressure_taps = pipes[pipe].distance_between_pressure_taps
         development_length             = pipes[pipe].development_length()
@@ -511,5 +497,9 @@ with open( shear_stress_filename, "r" ) as shear_stress_file:
         sd.set_labeled_value( cursor, station_identifier, sd.Q_WALL_TO_RECOVERY_TEMPERATURE_RATIO,    sd.WALL_POINT_LABEL, sd.sdfloat( 1.0, 0.0 ),            averaging_system=sd.BOTH_AVERAGING_SYSTEMS, measurement_techniques=[sd.MT_ASSUMPTION],                                                         )
         sd.set_labeled_value( cursor, station_identifier, sd.Q_FRICTION_TEMPERATURE,                  sd.WALL_POINT_LABEL, sd.sdfloat( 0.0, 0.0 ),            averaging_system=sd.BOTH_AVERAGING_SYSTEMS, measurement_techniques=[sd.MT_ASSUMPTION],                                                         )
 
-conn.commit()
-conn.close()
+if ( __name__ == "__main__" ):
+    conn   = sd.open_database( sys.argv[1], sd.INGEST_DATABASE_MODE )
+    cursor = conn.cursor()
+    ingest( cursor )
+    conn.commit()
+    conn.close()
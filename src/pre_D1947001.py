@@ -4,109 +4,101 @@
 #
 # SPDX-License-Identifier: MIT
 
-import csv
 import math
-import sqlite3
 import sheardata as sd
 import sys
 
-conn   = sqlite3.connect( sys.argv[1] )
-cursor = conn.cursor()
-cursor.execute( "PRAGMA foreign_keys = ON;" )
-
-flow_class   = sd.DUCT_FLOW_CLASS
-year         = 1947
-study_number = 1
-
-study_identifier = sd.add_study(
-    cursor,
-    flow_class=flow_class,
-    year=year,
-    study_number=study_number,
-    study_type=sd.EXPERIMENTAL_STUDY_TYPE,
-)
-
-sd.add_source( cursor, study_identifier, "HuebscherRG+1947+eng+JOUR", 1 )
+def ingest( cursor ):
+    flow_class   = sd.DUCT_FLOW_CLASS
+    year         = 1947
+    study_number = 1
+
+    study_identifier = sd.add_study(
+        cursor,
+        flow_class=flow_class,
+        year=year,
+        study_number=study_number,
+        study_type=sd.EXPERIMENTAL_STUDY_TYPE,
+    )
 
-mass_density_note = sd.add_note(
-    cursor,
-    "../data/{:s}/note_mass_density.tex".format( study_identifier ),
-)
+    sd.add_source( cursor, study_identifier, "HuebscherRG+1947+eng+JOUR", 1 )
 
-# Distance between pressure taps
-#
-# p. 129
-#
-# \begin{quote}
-# Static pressure explorations made within the rectangular duct on a single
-# plane perpendicular to the long axis of the duct disclosed no measureable
-# variation over the cross-section.  A single internal static pressure taken at
-# the axis of the duct at several locations along the duct length served to
-# define the static friction pressure gradient.
-#
-# It was found that insertion of the tubes into the duct caused sufficient
-# resistance to decrease the air flow in the round and square ducts.  Since
-# this eeffect was negligible when insertion was less than 2 in. the tubes were
-# never inserted for more than 2 in.  Openings for static tube insertion were
-# located every 3 ft along the length of the duct.
-# \end{quote}
-#
-# Note that this does not give any information about the distance that was used
-# in the study, just that it was in 3 foot increments.
-
-class Duct:
-    aspect_ratio = None
-    length       = None
-
-    def __init__( self, aspect_ratio, length ):
-        self.aspect_ratio = sd.sdfloat(aspect_ratio)
-        self.length       = sd.sdfloat(length)
-
-ducts = {}
-globals_filename = "../data/{:s}/globals.csv".format( study_identifier )
-with open( globals_filename, "r" ) as globals_file:
-    globals_reader = csv.reader(
-        globals_file,
-        delimiter=",",
-        quotechar='"', \
-        skipinitialspace=True,
+    mass_density_note = sd.add_note(
+        cursor,
+        "../data/{:s}/note_mass_density.tex".format( study_identifier ),
     )
-    next(globals_reader)
-    for globals_row in globals_reader:
-        ducts[str(globals_row[0])] = Duct(
-            float(globals_row[1]),
-            float(globals_row[2]) * sd.METERS_PER_FOOT
-        )
 
-
-series_number = 0
-for duct in ducts:
-    duct_globals_filename = "../data/{:s}/{:s}_duct_globals.csv".format(
-        study_identifier,
-        duct.lower(),
+    # Distance between pressure taps
+    #
+    # p. 129
+    #
+    # \begin{quote}
+    # Static pressure explorations made within the rectangular duct on a single
+    # plane perpendicular to the long axis of the duct disclosed no measureable
+    # variation over the cross-section.  A single internal static pressure taken at
+    # the axis of the duct at several locations along the duct length served to
+    # define the static friction pressure gradient.
+    #
+    # It was found that insertion of the tubes into the duct caused sufficient
+    # resistance to decrease the air flow in the round and square ducts.  Since
+    # this eeffect was negligible when insertion was less than 2 in. the tubes were
+    # never inserted for more than 2 in.  Openings for static tube insertion were
+    # located every 3 ft along the length of the duct.
+    # \end{quote}
+    #
+    # Note that this does not give any information about the distance that was used
+    # in the study, just that it was in 3 foot increments.
+
+    class Duct:
+        aspect_ratio = None
+        length       = None
+
+        def __init__( self, aspect_ratio, length ):
+            self.aspect_ratio = sd.sdfloat(aspect_ratio)
+            self.length       = sd.sdfloat(length)
+
+    ducts = {}
+    globals_filename = "../data/{:s}/globals.csv".format( study_identifier )
+    duct_names, aspect_ratios, lengths = sd.read_profile_file(
+        globals_filename,
+        [
+            sd.ProfileColumn( "Duct",         transform=str,            ),
+            sd.ProfileColumn( "Aspect ratio",                           ),
+            sd.ProfileColumn( "Length",       scale=sd.METERS_PER_FOOT, ),
+        ],
     )
-    with open( duct_globals_filename, "r" ) as duct_globals_file:
-        duct_globals_reader = csv.reader(
-            duct_globals_file,
-            delimiter=",",
-            quotechar='"', \
-            skipinitialspace=True,
+    for duct, aspect_ratio, length in zip( duct_names, aspect_ratios.nominal, \
+                                           lengths.nominal ):
+        ducts[duct] = Duct( aspect_ratio, length )
+
+    series_number = 0
+    for duct in ducts:
+        duct_globals_filename = "../data/{:s}/{:s}_duct_globals.csv".format(
+            study_identifier,
+            duct.lower(),
+        )
+        duct_globals = sd.read_profile_file(
+            duct_globals_filename,
+            [
+                sd.ProfileColumn( "Test no.",           transform=str, ),
+                sd.ProfileColumn( "Temperature",        transform=lambda cell: sd.fahrenheit_to_kelvin( float(cell) ), ),
+                sd.ProfileColumn( "Density",            scale=sd.KILOGRAM_PER_POUND_MASS / sd.METERS_PER_FOOT**3.0,   ),
+                sd.ProfileColumn( "Mean velocity",      scale=sd.METERS_PER_FOOT / sd.SECONDS_PER_MINUTE,             ),
+                sd.ProfileColumn( "Hydraulic diameter", scale=sd.METERS_PER_INCH,                                     ),
+                sd.ProfileColumn( "Pressure gradient",  scale=sd.PASCALS_PER_INCH_OF_WATER / sd.METERS_PER_FOOT,      ),
+                sd.ProfileColumn( "R_e",                                                                              ),
+            ],
         )
-        next(duct_globals_reader)
-        for duct_globals_row in duct_globals_reader:
+        for test_number, temperature, mass_density, bulk_velocity,      \
+            hydraulic_diameter, pressure_gradient, Re_bulk_value in zip( \
+            *duct_globals ):
             series_number += 1
 
-            test_number = int(duct_globals_row[0])
+            test_number = int(test_number)
             originators_identifier = "{:s} duct {:d}".format(
                 duct,
                 test_number
             )
-            temperature        = sd.fahrenheit_to_kelvin( sd.sdfloat(duct_globals_row[2]) )
-            mass_density       = sd.sdfloat(duct_globals_row[4]) * sd.KILOGRAM_PER_POUND_MASS / sd.METERS_PER_FOOT**3.0
-            bulk_velocity      = sd.sdfloat(duct_globals_row[5]) * sd.METERS_PER_FOOT / sd.SECONDS_PER_MINUTE
-            hydraulic_diameter = sd.sdfloat(duct_globals_row[6]) * sd.METERS_PER_INCH
-            pressure_gradient  = sd.sdfloat(duct_globals_row[7]) * sd.PASCALS_PER_INCH_OF_WATER / sd.METERS_PER_FOOT
-            Re_bulk_value      = sd.sdfloat(duct_globals_row[10])
 
             # Duct dimensions
             #
@@ -329,5 +321,9 @@ for duct in ducts:
             sd.set_labeled_value( cursor, station_identifier, sd.Q_WALL_TO_RECOVERY_TEMPERATURE_RATIO,    sd.WALL_POINT_LABEL, sd.sdfloat( 1.0, 0.0 ),  averaging_system=sd.BOTH_AVERAGING_SYSTEMS, measurement_techniques=[sd.MT_ASSUMPTION],     )
             sd.set_labeled_value( cursor, station_identifier, sd.Q_FRICTION_TEMPERATURE,                  sd.WALL_POINT_LABEL, sd.sdfloat( 0.0, 0.0 ),  averaging_system=sd.BOTH_AVERAGING_SYSTEMS, measurement_techniques=[sd.MT_ASSUMPTION],     )
 
-conn.commit()
-conn.close()
+if ( __name__ == "__main__" ):
+    conn   = sd.open_database( sys.argv[1], sd.INGEST_DATABASE_MODE )
+    cursor = conn.cursor()
+    ingest( cursor )
+    conn.commit()
+    conn.close()
@@ -4,10 +4,49 @@
 #
 # SPDX-License-Identifier: MIT
 
+import atexit
+import csv
+import functools
+import glob
+import hashlib
+import importlib
+import importlib.util
 import math
-import numpy as np
+import os
 import sqlite3
-from uncertainties import ufloat
+import sys
+import time
+
+# The resource module only exists on Unix, and only the ingest statistics use
+# it.
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# NumPy and the uncertainties package take far longer to import than the rest
+# of this module, and many of the preprocessing scripts only insert metadata
+# and never need them.  A LazyModule stands in for a module and only imports
+# it when one of its attributes is first used, so scripts that never touch the
+# profile or uncertainty functions never pay for those imports.
+class LazyModule:
+    def __getattr__( self, attribute ):
+        module = self.__dict__["module"]
+        if ( module is None ):
+            module = importlib.import_module( self.__dict__["name"] )
+            self.__dict__["module"] = module
+        return getattr( module, attribute )
+
+    def __repr__( self ):
+        return "LazyModule({:s})".format( repr(self.__dict__["name"]) )
+
+    def __init__( self, name ):
+        self.__dict__["name"]   = name
+        self.__dict__["module"] = None
+
+np            = LazyModule( "numpy" )
+uncertainties = LazyModule( "uncertainties" )
+unp           = LazyModule( "uncertainties.unumpy" )
 
 # Physical constants
 ABSOLUTE_ZERO                       =    273.15
@@ -300,6 +339,262 @@ DIRECT_NUMERICAL_SIMULATION_STUDY_TYPE = "DNS"
 EXPERIMENTAL_STUDY_TYPE                = "EXP"
 LARGE_EDDY_SIMULATION_STUDY_TYPE       = "LES"
 
+# Database modes
+INGEST_DATABASE_MODE = "ingest"
+READ_DATABASE_MODE   = "read"
+
+# Database settings (the cache size is in kibibytes and the memory map size is
+# in bytes)
+DATABASE_CACHE_SIZE = 262144
+DATABASE_MMAP_SIZE  = 1073741824
+
+# Largest number of identifiers in a single IN list (SQLite versions before
+# 3.32 allow at most 999 parameters in a statement)
+QUERY_CHUNK_SIZE = 500
+
+# Station summary
+#
+# The station summary has a column for each of these quantities and each
+# averaging system (the column names have no suffix for values without an
+# averaging system).  The wall quantities are the values at the wall point.
+SUMMARY_STATION_QUANTITIES = {
+    Q_ASPECT_RATIO:                       "aspect_ratio",
+    Q_BULK_MACH_NUMBER:                   "bulk_mach_number",
+    Q_BULK_REYNOLDS_NUMBER:               "bulk_reynolds_number",
+    Q_BULK_TO_CENTER_LINE_VELOCITY_RATIO: "bulk_to_center_line_velocity_ratio",
+    Q_OUTER_LAYER_DEVELOPMENT_LENGTH:     "outer_layer_development_length",
+}
+
+SUMMARY_WALL_QUANTITIES = {
+    Q_CENTER_LINE_TO_WALL_TEMPERATURE_RATIO: "wall_center_line_to_wall_temperature_ratio",
+    Q_FANNING_FRICTION_FACTOR:               "wall_fanning_friction_factor",
+    Q_INNER_LAYER_ROUGHNESS_HEIGHT:          "wall_inner_layer_roughness_height",
+}
+
+SUMMARY_AVERAGING_SYSTEMS = {
+    None:                              "",
+    UNWEIGHTED_AVERAGING_SYSTEM:       "_uw",
+    DENSITY_WEIGHTED_AVERAGING_SYSTEM: "_dw",
+}
+
+# Setting this environment variable to anything other than an empty string
+# profiles every statement run on the connections opened by open_database and
+# prints a report when the process exits.
+PROFILE_ENVIRONMENT_VARIABLE = "SHEARDATA_PROFILE"
+PROFILE_REPORT_LENGTH        = 25
+
+# Setting this environment variable to anything other than an empty string
+# records the time, the number of statement executions, the increase in the
+# peak memory use of the process, and the number of rows inserted in each table
+# for every study that ingest_study inserts.
+INGEST_STATS_ENVIRONMENT_VARIABLE = "SHEARDATA_INGEST_STATS"
+
+# Tables that contain the data from the studies (rather than the definitions
+# created with the tables), in an order that satisfies the foreign key
+# constraints.
+DATA_TABLES = [ "notes",
+                "studies",
+                "study_inputs",
+                "ingest_stats",
+                "ingest_table_stats",
+                "series",
+                "stations",
+                "points",
+                "sources",
+                "components",
+                "study_values",
+                "series_values",
+                "station_values",
+                "point_values",
+                "study_values_mt",
+                "series_values_mt",
+                "station_values_mt",
+                "point_values_mt",
+                "study_notes",
+                "study_value_notes",
+                "series_notes",
+                "series_value_notes",
+                "station_notes",
+                "station_value_notes",
+                "point_notes",
+                "point_value_notes", ]
+
+# Connections opened by open_database also carry a cache of the labeled
+# points, mapping each pair of a station and a point label to the first point
+# with that label.  add_point fills it in as points are inserted, and
+# delete_study empties it.  Connections opened any other way have no cache
+# and always query the database.
+#
+# They also keep the atomic weights of the elements once they are first
+# needed, since the elements never change after create_tables.py.
+class DatabaseConnection( sqlite3.Connection ):
+    def __init__( self, *args, **kwargs ):
+        super().__init__( *args, **kwargs )
+        self.labeled_points = {}
+        self.atomic_weights = None
+
+def labeled_point_cache( cursor ):
+    return getattr( cursor.connection, "labeled_points", None )
+
+# Statement profiles
+#
+# The profile of each statement records how many times it ran, the total time
+# spent running it and fetching its results, and its query plan.  Statements
+# are identified by their SQL with the whitespace collapsed, so the same
+# statement run with different parameters has a single profile.
+class StatementProfile:
+    def __init__( self, sql ):
+        self.sql   = sql
+        self.count = 0
+        self.time  = 0.0
+        self.plan  = []
+
+statement_profiles = {}
+
+def profile_statement( sql ):
+    key = " ".join( sql.split() )
+    if ( key not in statement_profiles ):
+        statement_profiles[key] = StatementProfile( key )
+    return statement_profiles[key]
+
+# Cursors of profiled connections time each statement and every fetch of its
+# results, and run EXPLAIN QUERY PLAN on each statement the first time it
+# runs.  Statements run using executemany are timed but not explained.
+class ProfilingCursor( sqlite3.Cursor ):
+    def execute( self, sql, parameters=() ):
+        profile = profile_statement( sql )
+        if ( profile.count == 0 ):
+            profile.plan = explain_query_plan( self.connection, sql, parameters )
+        self.profile = profile
+        start = time.perf_counter()
+        try:
+            return super().execute( sql, parameters )
+        finally:
+            profile.count += 1
+            profile.time  += time.perf_counter() - start
+
+    def executemany( self, sql, parameters ):
+        profile = profile_statement( sql )
+        self.profile = profile
+        start = time.perf_counter()
+        try:
+            return super().executemany( sql, parameters )
+        finally:
+            profile.count += 1
+            profile.time  += time.perf_counter() - start
+
+    def timed_fetch( self, fetch, *args ):
+        start = time.perf_counter()
+        try:
+            return fetch( *args )
+        finally:
+            if ( self.profile != None ):
+                self.profile.time += time.perf_counter() - start
+
+    def fetchone( self ):
+        return self.timed_fetch( super().fetchone )
+
+    def fetchmany( self, *args ):
+        return self.timed_fetch( super().fetchmany, *args )
+
+    def fetchall( self ):
+        return self.timed_fetch( super().fetchall )
+
+    def __next__( self ):
+        return self.timed_fetch( super().__next__ )
+
+    def __init__( self, *args, **kwargs ):
+        super().__init__( *args, **kwargs )
+        self.profile = None
+
+class ProfilingConnection( DatabaseConnection ):
+    def cursor( self, factory=ProfilingCursor ):
+        return super().cursor( factory )
+
+def explain_query_plan( conn, sql, parameters ):
+    words = sql.split()
+    if ( len(words) == 0 or words[0].upper() not in [ "SELECT", "INSERT",
+                                                      "UPDATE", "DELETE",
+                                                      "WITH", ] ):
+        return []
+    cursor = sqlite3.Cursor( conn )
+    try:
+        cursor.execute( "EXPLAIN QUERY PLAN "+sql, parameters )
+        return [ str(result[3]) for result in cursor.fetchall() ]
+    except sqlite3.Error:
+        return []
+    finally:
+        cursor.close()
+
+# Prints the statements that took the most time, along with their query plans.
+# Full table scans (plans that contain SCAN without an index) are marked.
+def print_profile_report( file=sys.stderr ):
+    if ( len(statement_profiles) == 0 ):
+        return
+    profiles = sorted(
+        statement_profiles.values(),
+        key=lambda profile: profile.time,
+        reverse=True,
+    )
+    total_time = sum( profile.time for profile in profiles )
+    print(
+        "Statement profile: {:d} statements, {:.3f} s in total".format(
+            len(profiles),
+            total_time,
+        ),
+        file=file,
+    )
+    for rank, profile in enumerate( profiles[:PROFILE_REPORT_LENGTH], 1 ):
+        print(
+            "{:3d}. {:9.3f} s {:9d} calls {:11.1f} us/call".format(
+                rank,
+                profile.time,
+                profile.count,
+                1.0e6 * profile.time / max( profile.count, 1 ),
+            ),
+            file=file,
+        )
+        print( "     "+profile.sql, file=file )
+        for step in profile.plan:
+            marker = " "
+            if ( step.startswith( "SCAN" ) and "INDEX" not in step ):
+                marker = "!"
+            print( "    {:s} {:s}".format( marker, step ), file=file )
+
+# Opens the database with settings tuned for either inserting data or reading
+# it.  Ingest mode trades durability for speed: the rollback journal stays in
+# memory and SQLite does not wait for writes to reach the disk.  A failed
+# script can still roll back its own transaction, but a crash of the whole
+# machine during a build can corrupt the database, which the build would
+# recreate anyway.  Ingest mode also leaves the foreign keys unenforced, so
+# that inserts do not look up every referenced row one at a time; the build
+# checks all of them at once with check_foreign_keys instead.  Read mode maps
+# the database into memory and enforces the foreign keys.
+#
+# If the profiling environment variable is set, the connection is profiled
+# instead, and the report is printed when the process exits.
+def open_database( filename, mode=READ_DATABASE_MODE ):
+    factory = DatabaseConnection
+    if ( os.environ.get( PROFILE_ENVIRONMENT_VARIABLE, "" ) != "" ):
+        factory = ProfilingConnection
+        atexit.unregister( print_profile_report )
+        atexit.register( print_profile_report )
+    conn   = sqlite3.connect( filename, factory=factory )
+    cursor = conn.cursor()
+    cursor.execute( "PRAGMA temp_store = MEMORY;" )
+    cursor.execute( "PRAGMA cache_size = {:d};".format( -DATABASE_CACHE_SIZE ) )
+    if ( mode == INGEST_DATABASE_MODE ):
+        cursor.execute( "PRAGMA foreign_keys = OFF;" )
+        cursor.execute( "PRAGMA journal_mode = MEMORY;" )
+        cursor.execute( "PRAGMA synchronous = OFF;" )
+    elif ( mode == READ_DATABASE_MODE ):
+        cursor.execute( "PRAGMA foreign_keys = ON;" )
+        cursor.execute( "PRAGMA mmap_size = {:d};".format( DATABASE_MMAP_SIZE ) )
+    else:
+        raise ValueError( "unknown database mode: {:s}".format( str(mode) ) )
+    cursor.close()
+    return conn
+
 def split_float( value ):
     if ( isinstance( value, float ) ):
         sql_value       = value
@@ -317,95 +612,351 @@ def sdfloat( sql_value, sql_uncertainty=None ):
         uncertainty = float("nan")
     else:
         uncertainty = float(sql_uncertainty)
-    return ufloat( float(sql_value), uncertainty )
+    return uncertainties.ufloat( float(sql_value), uncertainty )
 
 def fetch_float( cursor ):
     result = cursor.fetchone()
     return sdfloat( result[0], result[1] )
 
+# Splits any value (an SDArray, a ufloat, an array of ufloats, or an ordinary
+# number or array) into its nominal values and its uncertainties.  Ordinary
+# numbers are exact.
+def split_array( value ):
+    if ( isinstance( value, SDArray ) ):
+        return value.nominal, value.std_dev
+    elif ( hasattr( value, "nominal_value" ) ):
+        return float(value.n), float(value.s)
+    else:
+        array = np.asarray( value )
+        if ( array.dtype == object ):
+            return unp.nominal_values( array ), unp.std_devs( array )
+        else:
+            array = array.astype( float )
+            return array, np.zeros_like( array )
+
+# Exact operands contribute nothing to the uncertainty, even when the
+# derivative with respect to them is not finite.
+def propagate_uncertainty( derivatives, uncertainties ):
+    variance = 0.0
+    for derivative, uncertainty in zip( derivatives, uncertainties ):
+        with np.errstate( invalid="ignore" ):
+            contribution = np.where(
+                uncertainty == 0.0,
+                0.0,
+                derivative * uncertainty,
+            )
+        variance = variance + contribution**2.0
+    return variance**0.5
+
+# An SDArray stores a profile as two float arrays, one for the nominal values
+# and one for the standard uncertainties.  Arithmetic propagates the
+# uncertainties linearly and assumes that all operands are uncorrelated.  The
+# uncertainties package instead tracks the correlations of every element
+# separately, which is exact but slow and uses much more memory.  Use
+# to_uarray to convert back when the correlations matter.
+class SDArray:
+    nominal = None
+    std_dev = None
+
+    # Prevent NumPy from treating an SDArray as an array of objects, so that
+    # the reflected operators below handle arithmetic with NumPy arrays.
+    __array_ufunc__ = None
+
+    def __len__( self ):
+        return len(self.nominal)
+
+    def __getitem__( self, key ):
+        nominal = self.nominal[key]
+        std_dev = self.std_dev[key]
+        if ( np.ndim( nominal ) == 0 ):
+            return uncertainties.ufloat( float(nominal), float(std_dev) )
+        else:
+            return SDArray( nominal, std_dev )
+
+    def __iter__( self ):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__( self ):
+        return "SDArray({:s}, {:s})".format(
+            repr(self.nominal),
+            repr(self.std_dev),
+        )
+
+    @property
+    def shape( self ):
+        return self.nominal.shape
+
+    def to_uarray( self ):
+        return unp.uarray( self.nominal, self.std_dev )
+
+    def __neg__( self ):
+        return SDArray( -self.nominal, self.std_dev )
+
+    def __pos__( self ):
+        return SDArray( self.nominal, self.std_dev )
+
+    def __abs__( self ):
+        return SDArray( np.abs( self.nominal ), self.std_dev )
+
+    def __add__( self, other ):
+        n1, s1 = self.nominal, self.std_dev
+        n2, s2 = split_array( other )
+        return SDArray(
+            n1 + n2,
+            propagate_uncertainty( ( 1.0, 1.0, ), ( s1, s2, ) ),
+        )
+
+    def __radd__( self, other ):
+        return self.__add__( other )
+
+    def __sub__( self, other ):
+        n1, s1 = self.nominal, self.std_dev
+        n2, s2 = split_array( other )
+        return SDArray(
+            n1 - n2,
+            propagate_uncertainty( ( 1.0, -1.0, ), ( s1, s2, ) ),
+        )
+
+    def __rsub__( self, other ):
+        return ( -self ).__add__( other )
+
+    def __mul__( self, other ):
+        n1, s1 = self.nominal, self.std_dev
+        n2, s2 = split_array( other )
+        return SDArray(
+            n1 * n2,
+            propagate_uncertainty( ( n2, n1, ), ( s1, s2, ) ),
+        )
+
+    def __rmul__( self, other ):
+        return self.__mul__( other )
+
+    def __truediv__( self, other ):
+        n1, s1 = self.nominal, self.std_dev
+        n2, s2 = split_array( other )
+        with np.errstate( divide="ignore", invalid="ignore" ):
+            return SDArray(
+                n1 / n2,
+                propagate_uncertainty(
+                    ( 1.0 / n2, -n1 / n2**2.0, ),
+                    ( s1, s2, ),
+                ),
+            )
+
+    def __rtruediv__( self, other ):
+        return SDArray( *split_array( other ) ).__truediv__( self )
+
+    def __pow__( self, other ):
+        n1, s1 = self.nominal, self.std_dev
+        n2, s2 = split_array( other )
+        with np.errstate( divide="ignore", invalid="ignore" ):
+            value = n1**n2
+            return SDArray(
+                value,
+                propagate_uncertainty(
+                    ( n2 * n1**( n2 - 1.0 ), value * np.log( n1 ), ),
+                    ( s1, s2, ),
+                ),
+            )
+
+    def __rpow__( self, other ):
+        return SDArray( *split_array( other ) ).__pow__( self )
+
+    def __init__( self, nominal, std_dev=None ):
+        self.nominal = np.array( nominal, dtype=float, ndmin=1 )
+        if ( std_dev is None ):
+            self.std_dev = np.full_like( self.nominal, float("nan") )
+        else:
+            self.std_dev = np.broadcast_to(
+                np.array( std_dev, dtype=float ),
+                self.nominal.shape,
+            ).copy()
+
+# Converts arrays of ufloats (or ordinary arrays, which are exact) into an
+# SDArray.
+def to_sdarray( values ):
+    return SDArray( *split_array( values ) )
+
+# Identifiers
+#
+# An identifier consists of fixed-width fields: the flow class (1 character),
+# the year (4 digits), and the study (3 digits), series (3 digits), station (3
+# digits), and point (4 digits) numbers.  The identifier of a study has only
+# the first three fields, a series the first four, and so on.  The readable
+# form separates the fields with hyphens.  Each form is created with a single
+# format string rather than by formatting each level in turn.
+IDENTIFIER_FIELD_WIDTHS = [ 1, 4, 3, 3, 3, 4, ]
+
+IDENTIFIER_FORMATS = [
+    "{0:s}{1:04d}{2:03d}",
+    "{0:s}{1:04d}{2:03d}{3:03d}",
+    "{0:s}{1:04d}{2:03d}{3:03d}{4:03d}",
+    "{0:s}{1:04d}{2:03d}{3:03d}{4:03d}{5:04d}",
+]
+
+READABLE_IDENTIFIER_FORMATS = [
+    "{0:s}-{1:04d}-{2:03d}",
+    "{0:s}-{1:04d}-{2:03d}-{3:03d}",
+    "{0:s}-{1:04d}-{2:03d}-{3:03d}-{4:03d}",
+    "{0:s}-{1:04d}-{2:03d}-{3:03d}-{4:03d}-{5:04d}",
+]
+
+STUDY_IDENTIFIER_LENGTH   =  8
+SERIES_IDENTIFIER_LENGTH  = 11
+STATION_IDENTIFIER_LENGTH = 14
+POINT_IDENTIFIER_LENGTH   = 18
+
+# The fields of an identifier.  The fields below the level of the identifier
+# (the series number of a study, for example) are None.
+class Identifier:
+    __slots__ = ( "flow_class", "year", "study_number", "series_number",
+                  "station_number", "point_number", )
+
+    def fields( self ):
+        fields = [ self.flow_class, self.year, self.study_number,
+                   self.series_number, self.station_number, self.point_number, ]
+        while ( fields[-1] == None ):
+            fields.pop()
+        return fields
+
+    def readable( self ):
+        fields = self.fields()
+        return READABLE_IDENTIFIER_FORMATS[len(fields)-3].format( *fields )
+
+    def study( self ):
+        return Identifier( *self.fields()[:3] )
+
+    def series( self ):
+        return Identifier( *self.fields()[:4] )
+
+    def station( self ):
+        return Identifier( *self.fields()[:5] )
+
+    def range( self ):
+        return identifier_range( str(self) )
+
+    def __str__( self ):
+        fields = self.fields()
+        return IDENTIFIER_FORMATS[len(fields)-3].format( *fields )
+
+    def __repr__( self ):
+        return "Identifier('{:s}')".format( str(self) )
+
+    def __eq__( self, other ):
+        return isinstance( other, Identifier ) \
+               and self.fields() == other.fields()
+
+    def __hash__( self ):
+        return hash( tuple( self.fields() ) )
+
+    def __init__( self, flow_class, year, study_number, series_number=None, \
+                  station_number=None, point_number=None ):
+        self.flow_class     = str(flow_class)
+        self.year           = int(year)
+        self.study_number   = int(study_number)
+        self.series_number  = None
+        self.station_number = None
+        self.point_number   = None
+        if ( series_number != None ):
+            self.series_number = int(series_number)
+            if ( station_number != None ):
+                self.station_number = int(station_number)
+                if ( point_number != None ):
+                    self.point_number = int(point_number)
+
+# Parses an identifier (in either form) by slicing its fixed-width fields.
+def parse_identifier( identifier ):
+    sanitized_identifier = sanitize_identifier( identifier )
+    length = len(sanitized_identifier)
+    if ( length not in [ STUDY_IDENTIFIER_LENGTH,
+                         SERIES_IDENTIFIER_LENGTH,
+                         STATION_IDENTIFIER_LENGTH,
+                         POINT_IDENTIFIER_LENGTH, ] ):
+        raise ValueError(
+            "invalid identifier: {:s}".format( str(identifier) )
+        )
+
+    fields = []
+    position = 0
+    for width in IDENTIFIER_FIELD_WIDTHS:
+        if ( position >= length ):
+            break
+        fields.append( sanitized_identifier[position:position+width] )
+        position += width
+    return Identifier( *fields )
+
 def identify_study( flow_class, year, study_number, readable=False ):
-    separator = ""
     if ( readable ):
-        separator = "-"
-
-    return "{:1s}{:s}{:4d}{:s}{:3d}".format(
-        str(flow_class),
-        str(separator),
-        int(year),
-        str(separator),
-        int(study_number),
-    ).replace(" ","0")
+        return READABLE_IDENTIFIER_FORMATS[0].format(
+            str(flow_class), int(year), int(study_number),
+        )
+    return IDENTIFIER_FORMATS[0].format(
+        str(flow_class), int(year), int(study_number),
+    )
 
 def identify_series( flow_class, year, study_number, series_number, \
                      readable=False ):
-    separator = ""
     if ( readable ):
-        separator = "-"
-
-    return "{:s}{:s}{:3d}".format(
-        identify_study( flow_class, year, study_number, readable=readable, ),
-        str(separator),
-        int(series_number),
-    ).replace(" ","0")
+        return READABLE_IDENTIFIER_FORMATS[1].format(
+            str(flow_class), int(year), int(study_number), int(series_number),
+        )
+    return IDENTIFIER_FORMATS[1].format(
+        str(flow_class), int(year), int(study_number), int(series_number),
+    )
 
 def identify_station( flow_class, year, study_number, series_number, \
                       station_number, readable=False ):
-    separator = ""
     if ( readable ):
-        separator = "-"
-
-    return "{:s}{:s}{:3d}".format(
-        identify_series(
-            flow_class, year, study_number, series_number, readable=readable,
-        ),
-        str(separator),
+        return READABLE_IDENTIFIER_FORMATS[2].format(
+            str(flow_class), int(year), int(study_number), int(series_number),
+            int(station_number),
+        )
+    return IDENTIFIER_FORMATS[2].format(
+        str(flow_class), int(year), int(study_number), int(series_number),
         int(station_number),
-    ).replace(" ","0")
+    )
 
 def identify_point( flow_class, year, study_number, series_number, \
                     station_number, point_number, readable=False ):
-    separator = ""
     if ( readable ):
-        separator = "-"
-
-    return "{:s}{:s}{:4d}".format(
-        identify_station(
-            flow_class, year, study_number, series_number, station_number, \
-            readable=readable,
-        ),
-        str(separator),
-        int(point_number),
-    ).replace(" ","0")
+        return READABLE_IDENTIFIER_FORMATS[3].format(
+            str(flow_class), int(year), int(study_number), int(series_number),
+            int(station_number), int(point_number),
+        )
+    return IDENTIFIER_FORMATS[3].format(
+        str(flow_class), int(year), int(study_number), int(series_number),
+        int(station_number), int(point_number),
+    )
 
 def sanitize_identifier( identifier ):
     return identifier.replace("-","")
 
 def make_readable_identifier( identifier ):
-    sanitized_identifier = sanitize_identifier( identifier )
-    readable_identifier = sanitized_identifier[0:1] \
-                        + "-"                       \
-                        + sanitized_identifier[1:5] \
-                        + "-"                       \
-                        + sanitized_identifier[5:8]
-    if ( len(sanitized_identifier) > 8 ):
-        readable_identifier += "-" + sanitized_identifier[8:11]
-    if ( len(sanitized_identifier) > 11 ):
-        readable_identifier += "-" + sanitized_identifier[11:14]
-    if ( len(sanitized_identifier) > 14 ):
-        readable_identifier += "-" + sanitized_identifier[14:18]
-    return readable_identifier
+    return parse_identifier( identifier ).readable()
 
 def truncate_to_study( identifier ):
     sanitized_identifier = sanitize_identifier( identifier )
-    return sanitized_identifier[0:8]
+    return sanitized_identifier[0:STUDY_IDENTIFIER_LENGTH]
 
 def truncate_to_series( identifier ):
     sanitized_identifier = sanitize_identifier( identifier )
-    return sanitized_identifier[0:11]
+    return sanitized_identifier[0:SERIES_IDENTIFIER_LENGTH]
 
 def truncate_to_station( identifier ):
     sanitized_identifier = sanitize_identifier( identifier )
-    return sanitized_identifier[0:14]
+    return sanitized_identifier[0:STATION_IDENTIFIER_LENGTH]
+
+# The identifiers have fixed widths, so all identifiers that start with a
+# given identifier (all points in a station, for example) form a contiguous
+# range.  Queries should select this range rather than use LIKE, since SQLite
+# cannot use an index for a case-insensitive LIKE.
+def identifier_range( identifier ):
+    sanitized_identifier = sanitize_identifier( identifier )
+    lower_bound = sanitized_identifier
+    upper_bound = sanitized_identifier[:-1] \
+                + chr( ord( sanitized_identifier[-1] ) + 1 )
+    return lower_bound, upper_bound
 
 def add_study( cursor, flow_class, year, study_number, study_type, \
                outlier=False, notes=[], ):
@@ -440,6 +991,415 @@ def add_study( cursor, flow_class, year, study_number, study_type, \
 
     return study
 
+# Deletes a study and everything in it.  Every table in DATA_TABLES (other
+# than the notes) starts with a column that contains either the study
+# identifier or an identifier that starts with it, so the rows for the study
+# are a range in each table.  The notes only belong to a study through the
+# tables that refer to them, so only the notes referred to by the study are
+# deleted, and only if no other study refers to them too.
+def delete_study( cursor, study ):
+    lower_bound, upper_bound = identifier_range( study )
+
+    cache = labeled_point_cache( cursor )
+    if ( cache != None ):
+        cache.clear()
+
+    note_tables = []
+    for table in DATA_TABLES:
+        if ( table.endswith( "_notes" ) ):
+            note_tables.append( table )
+
+    notes = set()
+    for table in note_tables:
+        cursor.execute( "PRAGMA table_info({:s});".format( table ) )
+        column = str(cursor.fetchone()[1])
+        cursor.execute(
+        """
+        SELECT note
+        FROM {0:s}
+        WHERE {1:s} >= ? AND {1:s} < ?;
+        """.format( table, column ),
+        ( lower_bound, upper_bound, )
+        )
+        for result in cursor.fetchall():
+            notes.add( int(result[0]) )
+
+    for table in reversed(DATA_TABLES):
+        if ( table == "notes" ):
+            continue
+        cursor.execute( "PRAGMA table_info({:s});".format( table ) )
+        column = str(cursor.fetchone()[1])
+        cursor.execute(
+        """
+        DELETE FROM {0:s}
+        WHERE {1:s} >= ? AND {1:s} < ?;
+        """.format( table, column ),
+        ( lower_bound, upper_bound, )
+        )
+
+    for note in sorted(notes):
+        referred = False
+        for table in note_tables:
+            cursor.execute(
+            """
+            SELECT count(*)
+            FROM {:s}
+            WHERE note=?;
+            """.format( table ),
+            ( note, )
+            )
+            if ( int(cursor.fetchone()[0]) != 0 ):
+                referred = True
+                break
+        if ( not referred ):
+            cursor.execute(
+            """
+            DELETE FROM notes
+            WHERE note_id=?;
+            """,
+            ( note, )
+            )
+
+def get_study_input_hash( cursor, study ):
+    cursor.execute(
+    """
+    SELECT input_hash
+    FROM study_inputs
+    WHERE study=?;
+    """,
+    ( sanitize_identifier(study), )
+    )
+    result = cursor.fetchone()
+    if ( result == None ):
+        return None
+    else:
+        return str(result[0])
+
+def set_study_input_hash( cursor, study, input_hash ):
+    cursor.execute(
+    """
+    INSERT INTO study_inputs( study, input_hash )
+    VALUES( ?, ? );
+    """,
+    (
+        sanitize_identifier(study),
+        str(input_hash),
+    )
+    )
+
+# Ingest scripts
+#
+# Each preprocessing script pre_<study>.py defines a function ingest( cursor )
+# that inserts its study.  The inputs of a study are the script itself and the
+# files in the data directory for the study, and their hash decides whether
+# the study must be inserted again.
+def study_of_ingest_script( script ):
+    return os.path.basename( script )[len("pre_"):-len(".py")]
+
+def calculate_study_input_hash( script ):
+    study = study_of_ingest_script( script )
+
+    input_filenames = [ script ]
+    input_filenames.extend( sorted( glob.glob(
+        "../data/{:s}/*".format( study )
+    ) ) )
+
+    input_hash = hashlib.sha256()
+    for input_filename in input_filenames:
+        input_hash.update( os.path.basename( input_filename ).encode() )
+        with open( input_filename, "rb" ) as input_file:
+            input_hash.update( input_file.read() )
+    return input_hash.hexdigest()
+
+def load_ingest_function( script ):
+    name   = os.path.splitext( os.path.basename( script ) )[0]
+    spec   = importlib.util.spec_from_file_location( name, script )
+    module = importlib.util.module_from_spec( spec )
+    spec.loader.exec_module( module )
+    return module.ingest
+
+# Inserts the study of a preprocessing script, but only when its inputs
+# changed since the study was last inserted.  Any existing copy of the study
+# is deleted first.  Returns whether the study was inserted.  Nothing is
+# committed, so the caller decides where each transaction ends.
+def ingest_study( cursor, script ):
+    study      = study_of_ingest_script( script )
+    input_hash = calculate_study_input_hash( script )
+    if ( get_study_input_hash( cursor, study ) == input_hash ):
+        return False
+
+    delete_study( cursor, study )
+    ingest = load_ingest_function( script )
+    if ( os.environ.get( INGEST_STATS_ENVIRONMENT_VARIABLE, "" ) != "" ):
+        ingest_with_stats( cursor, study, ingest )
+    else:
+        ingest( cursor )
+    set_study_input_hash( cursor, study, input_hash )
+    return True
+
+# Ingest statistics
+#
+# The rows inserted for a study are counted afterwards using the same ranges of
+# identifiers that delete_study uses, rather than counted insert by insert.
+# The notes are not part of any range, so the number of notes inserted is the
+# change in the total number of notes.
+#
+# The trace callback runs each time SQLite starts executing a statement, not
+# once for each distinct statement or each call to execute.  An executemany
+# runs its statement once for every row, and the BEGIN and COMMIT statements
+# that the sqlite3 module issues implicitly are included, so the count is the
+# number of statement executions.
+class StatementExecutionCounter:
+    count = None
+
+    def __call__( self, sql ):
+        self.count += 1
+
+    def __init__( self ):
+        self.count = 0
+
+def count_notes( cursor ):
+    cursor.execute( "SELECT count(*) FROM notes;" )
+    return int(cursor.fetchone()[0])
+
+def count_study_rows( cursor, study ):
+    lower_bound, upper_bound = identifier_range( study )
+
+    row_counts = {}
+    for table in DATA_TABLES:
+        if ( table in [ "notes", "study_inputs", "ingest_stats",
+                        "ingest_table_stats", ] ):
+            continue
+        cursor.execute( "PRAGMA table_info({:s});".format( table ) )
+        column = str(cursor.fetchone()[1])
+        cursor.execute(
+        """
+        SELECT count(*)
+        FROM {0:s}
+        WHERE {1:s} >= ? AND {1:s} < ?;
+        """.format( table, column ),
+        ( lower_bound, upper_bound, )
+        )
+        row_counts[table] = int(cursor.fetchone()[0])
+    return row_counts
+
+# Returns the peak memory use of the process so far in bytes, or None if it is
+# not available.  Linux reports it in kibibytes and macOS in bytes.
+def peak_memory_use():
+    if ( resource == None ):
+        return None
+    peak_memory = resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss
+    if ( sys.platform != "darwin" ):
+        peak_memory *= 1024
+    return int(peak_memory)
+
+# The peak memory use of a process never decreases, and ingest_studies.py
+# inserts every study in the same process, so the peak at the end of a study
+# mostly reflects the studies before it.  Instead, each study records how much
+# it raised the peak, which is zero unless the study needed more memory than
+# any study before it.
+def ingest_with_stats( cursor, study, ingest ):
+    notes_before = count_notes( cursor )
+    peak_before  = peak_memory_use()
+
+    counter = StatementExecutionCounter()
+    cursor.connection.set_trace_callback( counter )
+    start_time = time.perf_counter()
+    try:
+        ingest( cursor )
+    finally:
+        elapsed_time = time.perf_counter() - start_time
+        cursor.connection.set_trace_callback( None )
+
+    row_counts = count_study_rows( cursor, study )
+    row_counts["notes"] = count_notes( cursor ) - notes_before
+
+    peak_memory_increase = None
+    if ( peak_before != None ):
+        peak_memory_increase = peak_memory_use() - peak_before
+
+    cursor.execute(
+    """
+    INSERT INTO ingest_stats( study, elapsed_time, statement_executions,
+                              rows_inserted, peak_memory_increase )
+    VALUES( ?, ?, ?, ?, ? );
+    """,
+    (
+        sanitize_identifier(study),
+        elapsed_time,
+        counter.count,
+        sum( row_counts.values() ),
+        peak_memory_increase,
+    )
+    )
+
+    for table in sorted(row_counts):
+        if ( row_counts[table] != 0 ):
+            cursor.execute(
+            """
+            INSERT INTO ingest_table_stats( study, table_name, rows_inserted )
+            VALUES( ?, ?, ? );
+            """,
+            (
+                sanitize_identifier(study),
+                table,
+                row_counts[table],
+            )
+            )
+
+# Prints the ingest statistics of every study, slowest study first, along with
+# the table with the most rows for each study.
+def print_ingest_stats( cursor, file=sys.stdout ):
+    cursor.execute(
+    """
+    SELECT study, elapsed_time, statement_executions, rows_inserted,
+           peak_memory_increase
+    FROM ingest_stats
+    ORDER BY elapsed_time DESC;
+    """
+    )
+    results = cursor.fetchall()
+    if ( len(results) == 0 ):
+        return
+
+    largest_tables = {}
+    cursor.execute(
+    """
+    SELECT study, table_name, max(rows_inserted)
+    FROM ingest_table_stats
+    GROUP BY study;
+    """
+    )
+    for result in cursor.fetchall():
+        largest_tables[str(result[0])] = "{:s} ({:d})".format(
+            str(result[1]),
+            int(result[2]),
+        )
+
+    print(
+        ( "Ingest statistics: {:d} studies, {:.3f} s, "
+          "{:d} statement executions, {:d} rows" ).format(
+            len(results),
+            sum( float(result[1]) for result in results ),
+            sum(   int(result[2]) for result in results ),
+            sum(   int(result[3]) for result in results ),
+        ),
+        file=file,
+    )
+    print(
+        "{:8s} {:>9s} {:>10s} {:>9s} {:>9s}  {:s}".format(
+            "study",
+            "time (s)",
+            "executions",
+            "rows",
+            "+peak MiB",
+            "largest table",
+        ),
+        file=file,
+    )
+    for study, elapsed_time, statement_executions, rows_inserted, \
+        peak_memory_increase in results:
+        if ( peak_memory_increase == None ):
+            peak_memory_increase = "-"
+        else:
+            peak_memory_increase = "{:.1f}".format(
+                int(peak_memory_increase) / 1024.0**2
+            )
+        print(
+            "{:8s} {:9.3f} {:10d} {:9d} {:>9s}  {:s}".format(
+                str(study),
+                float(elapsed_time),
+                int(statement_executions),
+                int(rows_inserted),
+                peak_memory_increase,
+                largest_tables.get( str(study), "-" ),
+            ),
+            file=file,
+        )
+
+# Checks every foreign key in the database at once and returns the violations
+# grouped by study.  Ingest mode does not enforce the foreign keys row by row,
+# so this check must run once all of the data is inserted.  Each violation is
+# a tuple of the table, the key of the row (the value in its first column, or
+# its row ID if that is not an identifier), and the table that the row refers
+# to.  Rows that do not belong to a study (in the notes or in the tables
+# created by create_tables.py) are grouped under None.
+#
+# PRAGMA foreign_key_check cannot give the row IDs of rows in WITHOUT ROWID
+# tables, so the rows that violate these foreign keys are found by checking
+# the foreign key again directly.
+def check_foreign_keys( cursor ):
+    cursor.execute( "PRAGMA foreign_key_check;" )
+    results = cursor.fetchall()
+
+    keys = []
+    unidentified = set()
+    for result in results:
+        table  = str(result[0])
+        rowid  = result[1]
+        parent = str(result[2])
+        if ( rowid == None ):
+            unidentified.add( ( table, int(result[3]), parent, ) )
+            continue
+        cursor.execute(
+        """
+        SELECT *
+        FROM {:s}
+        WHERE rowid=?;
+        """.format( table ),
+        ( int(rowid), )
+        )
+        row = cursor.fetchone()
+        key = rowid
+        if ( row != None and isinstance( row[0], str ) ):
+            key = row[0]
+        keys.append( ( table, key, parent, ) )
+
+    for table, fkid, parent in sorted(unidentified):
+        cursor.execute( "PRAGMA foreign_key_list({:s});".format( table ) )
+        conditions = []
+        not_null   = []
+        for result in cursor.fetchall():
+            if ( int(result[0]) == fkid ):
+                conditions.append( "p.{1:s}=c.{0:s}".format(
+                    str(result[3]),
+                    str(result[4]),
+                ) )
+                not_null.append( "c.{:s} IS NOT NULL".format( str(result[3]) ) )
+        cursor.execute( "PRAGMA table_info({:s});".format( table ) )
+        column = str(cursor.fetchone()[1])
+        cursor.execute(
+        """
+        SELECT c.{0:s}
+        FROM {1:s} AS c
+        WHERE {4:s} AND NOT EXISTS (
+            SELECT 1
+            FROM {2:s} AS p
+            WHERE {3:s}
+        );
+        """.format(
+            column,
+            table,
+            parent,
+            " AND ".join( conditions ),
+            " AND ".join( not_null ),
+        )
+        )
+        for result in cursor.fetchall():
+            keys.append( ( table, result[0], parent, ) )
+
+    violations = {}
+    for table, key, parent in keys:
+        study = None
+        if ( table in DATA_TABLES and table != "notes" \
+             and isinstance( key, str ) ):
+            study = truncate_to_study( key )
+        if ( study not in violations ):
+            violations[study] = []
+        violations[study].append( ( table, key, parent, ) )
+
+    return violations
+
 def update_study_description( cursor, identifier, description ):
     cursor.execute(
     """
@@ -584,11 +1544,7 @@ def add_series( cursor, flow_class, year, study_number, series_number,  \
         study_number,
         series_number,
     )
-    study = identify_study(
-        flow_class,
-        year,
-        study_number,
-    )
+    study = truncate_to_study( series )
     cursor.execute(
     """
     INSERT INTO series( identifier, study, series_number, number_of_dimensions,
@@ -758,17 +1714,8 @@ def add_station( cursor, flow_class, year, study_number, series_number,     \
         series_number,
         station_number,
     )
-    series = identify_series(
-        flow_class,
-        year,
-        study_number,
-        series_number,
-    )
-    study = identify_study(
-        flow_class,
-        year,
-        study_number,
-    )
+    series = truncate_to_series( station )
+    study  = truncate_to_study(  station )
     cursor.execute(
     """
     INSERT INTO stations( identifier, series, study, station_number,
@@ -892,14 +1839,6 @@ def get_station_value( cursor, station, quantity,             \
 def add_point( cursor, flow_class, year, study_number, series_number,         \
                station_number, point_number, point_label=None, outlier=False, \
                notes=[] ):
-    point = identify_point(
-        flow_class,
-        year,
-        study_number,
-        series_number,
-        station_number,
-        point_number,
-    )
     station = identify_station(
         flow_class,
         year,
@@ -907,102 +1846,339 @@ def add_point( cursor, flow_class, year, study_number, series_number,         \
         series_number,
         station_number,
     )
-    series = identify_series(
-        flow_class,
-        year,
-        study_number,
-        series_number,
-    )
-    study = identify_study(
-        flow_class,
-        year,
-        study_number,
-    )
-    cursor.execute(
-    """
-    INSERT INTO points( identifier, station, series, study, point_number,
-                        point_label, outlier )
-    VALUES( ?, ?, ?, ?, ?, ?, ? );
-    """,
-    (
-        point,
+    points = insert_points(
+        cursor,
         station,
-        series,
-        study,
-        int(point_number),
-        point_label,
-        int(outlier),
-    )
+        [ point_number ],
+        { point_number: point_label },
+        outlier=outlier,
+        notes=notes,
     )
-
-    for note in notes:
-        cursor.execute(
-        """
-        INSERT INTO point_notes( point, note )
-        VALUES( ?, ? );
-        """,
-        (
+    return points[0]
+
+# Point values are by far the most numerous records in the database, so
+# inserting them one statement at a time dominates the time needed to
+# preprocess large profiles.  This class accumulates the rows for the point
+# values, their measurement techniques, and their notes, and then inserts all
+# of them at once using executemany.  The rows are only visible to queries
+# after they are flushed.
+class PointValueBatch:
+    _point_values      = None
+    _point_values_mt   = None
+    _point_value_notes = None
+
+    # Both set_point_value and set_point_values add their rows here.  They only
+    # differ in how they split the values: an ordinary float given to
+    # set_point_value has an unknown uncertainty, like sdfloat, but an ordinary
+    # number or array given to set_point_values is exact, like in an SDArray.
+    def _append_value( self, point, quantity, point_value, point_uncertainty, \
+                       averaging_system, measurement_techniques, mt_set,    \
+                       outlier, notes ):
+        for avg_sys in create_averaging_systems_list( averaging_system ):
+            self._point_values.append( (
+                sanitize_identifier(point),
+                str(quantity),
+                point_value,
+                point_uncertainty,
+                avg_sys,
+                mt_set,
+                int(outlier),
+            ) )
+
+            for measurement_technique in measurement_techniques:
+                self._point_values_mt.append( (
+                    sanitize_identifier(point),
+                    str(quantity),
+                    avg_sys,
+                    mt_set,
+                    measurement_technique,
+                ) )
+
+            for note in notes:
+                self._point_value_notes.append( (
+                    sanitize_identifier(point),
+                    str(quantity),
+                    avg_sys,
+                    mt_set,
+                    int(note),
+                ) )
+
+    def set_point_value( self, point, quantity, value, averaging_system=None, \
+                         measurement_techniques=[], mt_set=1, outlier=False,  \
+                         notes=[] ):
+        point_value, point_uncertainty = split_float( value )
+        self._append_value(
             point,
-            int(note),
-        )
+            quantity,
+            point_value,
+            point_uncertainty,
+            averaging_system,
+            measurement_techniques,
+            mt_set,
+            outlier,
+            notes,
         )
 
-    return point
+    # Sets the same quantity for many points at once.  The values are an array
+    # (or SDArray) aligned with the points, or a single value for all of them.
+    def set_point_values( self, points, quantity, values,                    \
+                          averaging_system=None, measurement_techniques=[], \
+                          mt_set=1, outlier=False, notes=[] ):
+        nominal, std_dev = split_array( values )
+        nominal = np.broadcast_to( nominal, ( len(points), ) ).tolist()
+        std_dev = np.broadcast_to( std_dev, ( len(points), ) ).tolist()
+        for point, point_value, point_uncertainty in zip( points, nominal, \
+                                                          std_dev ):
+            if ( math.isnan( point_uncertainty ) ):
+                point_uncertainty = None
+            self._append_value(
+                point,
+                quantity,
+                point_value,
+                point_uncertainty,
+                averaging_system,
+                measurement_techniques,
+                mt_set,
+                outlier,
+                notes,
+            )
 
-def set_point_value( cursor, point, quantity, value, averaging_system=None, \
-                     measurement_techniques=[], mt_set=1, outlier=False,    \
-                     notes=[] ):
-    point_value, point_uncertainty = split_float( value )
-    for avg_sys in create_averaging_systems_list( averaging_system ):
-        cursor.execute(
+    def __len__( self ):
+        return len(self._point_values)
+
+    # The point values MUST be inserted before the measurement techniques and
+    # notes due to foreign key constraints.
+    def flush( self, cursor ):
+        cursor.executemany(
         """
         INSERT INTO point_values( point, quantity, point_value,
                                   point_uncertainty, averaging_system, mt_set,
                                   outlier )
         VALUES( ?, ?, ?, ?, ?, ?, ? );
         """,
-        (
-            sanitize_identifier(point),
-            str(quantity),
-            point_value,
-            point_uncertainty,
-            avg_sys,
-            mt_set,
-            int(outlier),
+        self._point_values
         )
+
+        cursor.executemany(
+        """
+        INSERT INTO point_values_mt( point, quantity, averaging_system,
+                                     mt_set, measurement_technique )
+        VALUES( ?, ?, ?, ?, ? );
+        """,
+        self._point_values_mt
         )
 
-        for measurement_technique in measurement_techniques:
-            cursor.execute(
-            """
-            INSERT INTO point_values_mt( point, quantity, averaging_system,
-                                         mt_set, measurement_technique )
-            VALUES( ?, ?, ?, ?, ? );
-            """,
-            (
-                sanitize_identifier(point),
-                str(quantity),
-                avg_sys,
-                mt_set,
-                measurement_technique,
-            )
-            )
+        cursor.executemany(
+        """
+        INSERT INTO point_value_notes( point, quantity, averaging_system,
+                                       mt_set, note )
+        VALUES( ?, ?, ?, ?, ? );
+        """,
+        self._point_value_notes
+        )
 
+        self._point_values      = []
+        self._point_values_mt   = []
+        self._point_value_notes = []
+
+    def __init__( self ):
+        self._point_values      = []
+        self._point_values_mt   = []
+        self._point_value_notes = []
+
+# Inserts the points of a station with the point numbers given in one
+# statement.  The point labels map point numbers to labels, and the outlier flag
+# and notes apply to every point.  Returns the points in the same order as the
+# point numbers.
+def insert_points( cursor, station, point_numbers, point_labels={}, \
+                   outlier=False, notes=[] ):
+    station = sanitize_identifier( station )
+    fields  = parse_identifier( station ).fields()
+    series  = truncate_to_series( station )
+    study   = truncate_to_study(  station )
+
+    points = []
+    rows   = []
+    for point_number in point_numbers:
+        point       = identify_point( *fields, point_number )
+        point_label = point_labels.get( point_number, None )
+        points.append( point )
+        rows.append( (
+            point,
+            station,
+            series,
+            study,
+            int(point_number),
+            point_label,
+            int(outlier),
+        ) )
+
+    cursor.executemany(
+    """
+    INSERT INTO points( identifier, station, series, study, point_number,
+                        point_label, outlier )
+    VALUES( ?, ?, ?, ?, ?, ?, ? );
+    """,
+    rows
+    )
+
+    cache = labeled_point_cache( cursor )
+    if ( cache != None ):
+        for point, station, series, study, point_number, point_label, outlier \
+            in rows:
+            if ( point_label != None ):
+                key = ( station, str(point_label) )
+                if ( key not in cache or point < cache[key] ):
+                    cache[key] = point
+
+    note_rows = []
+    for point in points:
         for note in notes:
-            cursor.execute(
-            """
-            INSERT INTO point_value_notes( point, quantity, averaging_system,
-                                           mt_set, note )
-            VALUES( ?, ?, ?, ?, ? );
-            """,
-            (
-                sanitize_identifier(point),
-                str(quantity),
-                avg_sys,
-                mt_set,
-                int(note),
-            )
-            )
+            note_rows.append( ( point, int(note) ) )
+
+    cursor.executemany(
+    """
+    INSERT INTO point_notes( point, note )
+    VALUES( ?, ? );
+    """,
+    note_rows
+    )
+
+    return points
+
+# Adds the points of a station numbered 1 to number_of_points.
+def add_points( cursor, station, number_of_points, point_labels={}, \
+                outlier=False, notes=[] ):
+    return insert_points(
+        cursor,
+        station,
+        range( 1, number_of_points+1 ),
+        point_labels,
+        outlier=outlier,
+        notes=notes,
+    )
+
+# Profile files
+#
+# Many studies give their profiles as CSV files with a header, one row per
+# point, and one column per quantity.  Tables of global parameters with one row
+# per series use the same format.  A ProfileColumn declares how one column maps
+# onto the database: the quantity, the averaging system, the measurement
+# techniques and notes of the values, and how to convert each cell into SI
+# units.  Columns are given by their header or by their index.
+#
+# Each cell is converted by the transform, float by default, and then
+# multiplied by the scale.  Use the transform for conversions that are not
+# just a factor, like from Fahrenheit to Kelvin, and transform=str for columns
+# of labels, which are not scaled.  The quantity is only needed for columns
+# that load_profile_file adds to the database.
+class ProfileColumn:
+    column                 = None
+    quantity               = None
+    averaging_system       = None
+    scale                  = None
+    transform              = None
+    measurement_techniques = None
+    notes                  = None
+
+    def __init__( self, column, quantity=None, averaging_system=None,    \
+                  scale=1.0, transform=float, measurement_techniques=[], \
+                  notes=[] ):
+        self.column                 = column
+        self.quantity               = None if quantity == None else str(quantity)
+        self.averaging_system       = averaging_system
+        self.scale                  = float(scale)
+        self.transform              = transform
+        self.measurement_techniques = list(measurement_techniques)
+        self.notes                  = list(notes)
+
+# Reads all of the columns of a profile file at once and returns a list with
+# an SDArray for each numeric ProfileColumn (and a list of strings for each
+# column of labels), in SI units, in the same order as the columns.  Several
+# ProfileColumns may read the same column of the file, each with its own scale.
+# The files do not give the uncertainties, so these are unknown (NaN), as with
+# sdfloat.
+#
+# The header and the data are both read with the csv module, so cells may be
+# quoted, whitespace after each comma is skipped, and rows may end with a
+# trailing comma.  Blank rows are skipped.  There are no comments.
+def read_profile_file( filename, columns ):
+    with open( filename, "r" ) as profile_file:
+        profile_reader = csv.reader(
+            profile_file,
+            delimiter=",",
+            quotechar='"',
+            skipinitialspace=True,
+        )
+        header = next( profile_reader )
+        rows   = []
+        for row in profile_reader:
+            if ( "".join( row ).strip() != "" ):
+                rows.append( row )
+
+    profile = []
+    for column in columns:
+        index = column.column
+        if ( not isinstance( index, int ) ):
+            index = header.index( column.column )
+
+        values = []
+        for row in rows:
+            values.append( column.transform( row[index] ) )
+
+        if ( column.transform == str ):
+            profile.append( values )
+        else:
+            profile.append( SDArray( column.scale * np.array( values, \
+                                                              dtype=float ) ) )
+    return profile
+
+# Adds the points of a station from a profile file along with the values in
+# the columns given, adding the values to a PointValueBatch.  Returns the
+# points and the profile (as returned by read_profile_file) so that the caller
+# can calculate other quantities from it.
+def load_profile_file( cursor, station, filename, columns, batch, \
+                       point_labels={} ):
+    profile = read_profile_file( filename, columns )
+
+    number_of_points = 0
+    if ( len(columns) != 0 ):
+        number_of_points = len(profile[0])
+    points = add_points( cursor, station, number_of_points, point_labels )
+
+    for column, values in zip( columns, profile ):
+        batch.set_point_values(
+            points,
+            column.quantity,
+            values,
+            averaging_system=column.averaging_system,
+            measurement_techniques=column.measurement_techniques,
+            notes=column.notes,
+        )
+
+    return points, profile
+
+def set_point_value( cursor, point, quantity, value, averaging_system=None, \
+                     measurement_techniques=[], mt_set=1, outlier=False,    \
+                     notes=[] ):
+    batch = PointValueBatch()
+    batch.set_point_value(
+        point,
+        quantity,
+        value,
+        averaging_system=averaging_system,
+        measurement_techniques=measurement_techniques,
+        mt_set=mt_set,
+        outlier=outlier,
+        notes=notes,
+    )
+    batch.flush( cursor )
+
+def bulk_set_point_values( cursor, rows ):
+    batch = PointValueBatch()
+    for row in rows:
+        batch.set_point_value( *row )
+    batch.flush( cursor )
 
 def get_point_value( cursor, point, quantity,               \
                      averaging_system=ANY_AVERAGING_SYSTEM, \
@@ -1038,134 +2214,679 @@ def get_point_value( cursor, point, quantity,               \
         )
     return fetch_float( cursor )
 
+# Both profiles are selected using a single self-join.  A point can have
+# several values for the same quantity if the averaging system is unspecified
+# or if there are several measurement technique sets, so the results are
+# sorted and only the first value for each point is kept, just like the LIMIT
+# in get_point_value.  The values returned also respect the averaging systems
+# given, not just the selection of the points.
 def get_twin_profiles( cursor, station, quantity1, quantity2, \
-                       averaging_system1=None, averaging_system2=None, ):
-    if ( averaging_system1 == None ):
-        if ( averaging_system2 == None ):
-            # Both averaging systems are unspecified.
+                       averaging_system1=None, averaging_system2=None, \
+                       as_sdarray=False, ):
+    lower_bound, upper_bound = identifier_range( station )
+    cursor.execute(
+    """
+    SELECT a.point, a.point_value, a.point_uncertainty,
+           b.point_value, b.point_uncertainty
+    FROM point_values AS a
+    JOIN point_values AS b ON b.point=a.point
+    WHERE a.point >= ? AND a.point < ?
+      AND a.quantity=? AND a.outlier=0
+      AND ( ? IS NULL OR a.averaging_system=? )
+      AND b.quantity=? AND b.outlier=0
+      AND ( ? IS NULL OR b.averaging_system=? )
+    ORDER BY a.point, a.averaging_system, a.mt_set,
+             b.averaging_system, b.mt_set;
+    """,
+    (
+        lower_bound,
+        upper_bound,
+        str(quantity1),
+        averaging_system1,
+        averaging_system1,
+        str(quantity2),
+        averaging_system2,
+        averaging_system2,
+    )
+    )
+
+    results = []
+    previous_point = None
+    for result in cursor.fetchall():
+        if ( result[0] != previous_point ):
+            results.append( result[1:] )
+            previous_point = result[0]
+
+    # NULL uncertainties become NaN.
+    values = np.array( results, dtype=float ).reshape( -1, 4 )
+
+    if ( as_sdarray ):
+        return SDArray( values[:,0], values[:,1] ), \
+               SDArray( values[:,2], values[:,3] )
+    else:
+        # NaN uncertainties stay NaN, as with sdfloat, but NumPy warns about
+        # them when the uncertainties package builds the arrays.
+        with np.errstate( invalid="ignore" ):
+            return unp.uarray( values[:,0], values[:,1] ), \
+                   unp.uarray( values[:,2], values[:,3] )
+
+# All of the point values of a station in columns.  The point numbers are the
+# index, and each quantity is an SDArray of the same length, so that the
+# values of the same point line up across quantities.  Values missing for a
+# point are NaN.
+class StationProfile:
+    def __contains__( self, quantity ):
+        return quantity in self.values
+
+    def __getitem__( self, quantity ):
+        return self.values[quantity]
+
+    def __len__( self ):
+        return len(self.point_numbers)
+
+    def quantities( self ):
+        return sorted( self.values )
+
+    def __init__( self, station, point_numbers, values ):
+        self.station       = station
+        self.point_numbers = point_numbers
+        self.values        = values
+
+# Loads a station using a single query rather than one query for each point
+# and quantity.  Every point in the station is included, even ones without
+# values.  If quantities is None, all quantities found are loaded; otherwise
+# the quantities given are loaded, even if they have no values at all.  As in
+# get_twin_profiles, only the first value for each point and quantity is kept.
+def load_station( cursor, station, quantities=None, \
+                  averaging_system=ANY_AVERAGING_SYSTEM, mt_set=1, ):
+    lower_bound, upper_bound = identifier_range( station )
+    if ( averaging_system == ANY_AVERAGING_SYSTEM ):
+        averaging_system = None
+
+    quantity_condition = ""
+    parameters = [ int(mt_set), averaging_system, averaging_system, ]
+    if ( quantities != None ):
+        quantities = [ str(quantity) for quantity in quantities ]
+        quantity_condition = "AND v.quantity IN ( {:s} )".format(
+            ", ".join( "?" for quantity in quantities )
+        )
+        parameters.extend( quantities )
+    parameters.extend( [ lower_bound, upper_bound, ] )
+
+    cursor.execute(
+    """
+    SELECT p.point_number, v.quantity, v.point_value, v.point_uncertainty
+    FROM points AS p
+    LEFT JOIN point_values AS v
+      ON v.point=p.identifier AND v.mt_set=?
+     AND ( ? IS NULL OR v.averaging_system=? )
+     {:s}
+    WHERE p.identifier >= ? AND p.identifier < ?
+    ORDER BY p.identifier, v.quantity, v.averaging_system;
+    """.format( quantity_condition ),
+    tuple(parameters)
+    )
+    results = cursor.fetchall()
+
+    point_numbers = []
+    for result in results:
+        if ( len(point_numbers) == 0 or result[0] != point_numbers[-1] ):
+            point_numbers.append( int(result[0]) )
+
+    if ( quantities == None ):
+        quantities = sorted( set(
+            str(result[1]) for result in results if result[1] != None
+        ) )
+
+    return StationProfile(
+        sanitize_identifier( station ),
+        np.array( point_numbers, dtype=int ),
+        pivot_values( point_numbers, quantities, results ),
+    )
+
+# Pivots rows of a key, a quantity, a value, and an uncertainty into an
+# SDArray for each quantity, aligned with the keys given.  Only the first row
+# for each key and quantity is kept, and rows without a quantity (from a LEFT
+# JOIN) are skipped.  Values missing for a key are NaN.
+def pivot_values( keys, quantities, results ):
+    rows = {}
+    for i, key in enumerate(keys):
+        if ( key not in rows ):
+            rows[key] = []
+        rows[key].append( i )
+
+    n_keys  = len(keys)
+    nominal = {}
+    std_dev = {}
+    filled  = {}
+    for quantity in quantities:
+        nominal[quantity] = np.full( n_keys, float("nan") )
+        std_dev[quantity] = np.full( n_keys, float("nan") )
+        filled[quantity]  = set()
+
+    for key, quantity, value, uncertainty in results:
+        if ( quantity == None or key in filled[quantity] ):
+            continue
+        filled[quantity].add( key )
+        for i in rows[key]:
+            nominal[quantity][i] = value
+            if ( uncertainty != None ):
+                std_dev[quantity][i] = uncertainty
+
+    values = {}
+    for quantity in quantities:
+        values[quantity] = SDArray( nominal[quantity], std_dev[quantity] )
+    return values
+
+# Loads the station values of many stations at once, for comparisons across
+# studies.  The stations are selected in chunks of QUERY_CHUNK_SIZE, so this
+# takes one query for every chunk rather than one query for every station and
+# quantity.  The result maps each quantity to an SDArray aligned with the
+# stations given.
+def load_station_values( cursor, stations, quantities, \
+                         averaging_system=ANY_AVERAGING_SYSTEM, mt_set=1, ):
+    stations   = [ sanitize_identifier( station ) for station in stations ]
+    quantities = [ str(quantity) for quantity in quantities ]
+    if ( averaging_system == ANY_AVERAGING_SYSTEM ):
+        averaging_system = None
+
+    results = []
+    for i in range( 0, len(stations), QUERY_CHUNK_SIZE ):
+        chunk = stations[i:i+QUERY_CHUNK_SIZE]
+        cursor.execute(
+        """
+        SELECT station, quantity, station_value, station_uncertainty
+        FROM station_values
+        WHERE station IN ( {:s} ) AND quantity IN ( {:s} ) AND mt_set=?
+          AND ( ? IS NULL OR averaging_system=? )
+        ORDER BY station, quantity, averaging_system;
+        """.format(
+            ", ".join( "?" for station in chunk ),
+            ", ".join( "?" for quantity in quantities ),
+        ),
+        tuple( chunk + quantities + [
+            int(mt_set),
+            averaging_system,
+            averaging_system,
+        ] )
+        )
+        results.extend( cursor.fetchall() )
+
+    return pivot_values( stations, quantities, results )
+
+# Loads the values at a labeled point (the wall, for example) of many
+# stations at once.  Like locate_labeled_point, this uses the first point
+# with the label in each station.
+def load_labeled_values( cursor, stations, quantities, label, \
+                         averaging_system=ANY_AVERAGING_SYSTEM, mt_set=1, ):
+    stations   = [ sanitize_identifier( station ) for station in stations ]
+    quantities = [ str(quantity) for quantity in quantities ]
+    if ( averaging_system == ANY_AVERAGING_SYSTEM ):
+        averaging_system = None
+
+    results = []
+    for i in range( 0, len(stations), QUERY_CHUNK_SIZE ):
+        chunk = stations[i:i+QUERY_CHUNK_SIZE]
+        cursor.execute(
+        """
+        SELECT p.station, v.quantity, v.point_value, v.point_uncertainty
+        FROM points AS p
+        JOIN point_values AS v ON v.point=p.identifier
+        WHERE p.station IN ( {:s} ) AND v.quantity IN ( {:s} ) AND v.mt_set=?
+          AND ( ? IS NULL OR v.averaging_system=? )
+          AND p.identifier=(
+            SELECT min(identifier)
+            FROM points
+            WHERE station=p.station AND point_label=?
+          )
+        ORDER BY p.station, v.quantity, v.averaging_system;
+        """.format(
+            ", ".join( "?" for station in chunk ),
+            ", ".join( "?" for quantity in quantities ),
+        ),
+        tuple( chunk + quantities + [
+            int(mt_set),
+            averaging_system,
+            averaging_system,
+            str(label),
+        ] )
+        )
+        results.extend( cursor.fetchall() )
+
+    return pivot_values( stations, quantities, results )
+
+# Station summary
+#
+# The station summary is a wide table with one row per station.  It holds the
+# properties of the study and series of each station and the values of the
+# quantities used most often to select stations, with a column for each
+# quantity and averaging system and an index on each of these columns.  The
+# table is derived entirely from the other tables, so it is dropped and
+# recreated after the data is inserted, rather than updated along with it.
+# Each column holds the first value (by point and by measurement technique
+# set) that is not an outlier; it is NULL if there is no such value.  A station
+# can have several such values for one quantity and averaging system (from
+# several measurement techniques or several labeled points), so for each
+# quantity a count column holds the largest number of these values for any one
+# averaging system.  StationQuery only trusts the summary columns when this
+# count is at most 1.
+def summary_columns():
+    columns = []
+    for quantities, label in [ ( SUMMARY_STATION_QUANTITIES, None, ),
+                               ( SUMMARY_WALL_QUANTITIES,    WALL_POINT_LABEL, ), ]:
+        for quantity in sorted(quantities):
+            for averaging_system in SUMMARY_AVERAGING_SYSTEMS:
+                column = quantities[quantity] \
+                       + SUMMARY_AVERAGING_SYSTEMS[averaging_system]
+                columns.append( ( column, quantity, averaging_system, label, ) )
+    return columns
+
+def summary_count_columns():
+    columns = []
+    for quantities, label in [ ( SUMMARY_STATION_QUANTITIES, None, ),
+                               ( SUMMARY_WALL_QUANTITIES,    WALL_POINT_LABEL, ), ]:
+        for quantity in sorted(quantities):
+            columns.append( ( quantities[quantity]+"_count", quantity, label, ) )
+    return columns
+
+def create_station_summary( cursor ):
+    cursor.execute( "DROP TABLE IF EXISTS station_summary;" )
+
+    value_columns = []
+    for column, quantity, averaging_system, label in summary_columns():
+        value_columns.append( "{:s} REAL DEFAULT NULL".format( column ) )
+        value_columns.append(
+            "{:s}_uncertainty REAL DEFAULT NULL".format( column )
+        )
+    for column, quantity, label in summary_count_columns():
+        value_columns.append(
+            "{:s} INTEGER NOT NULL DEFAULT 0".format( column )
+        )
+
+    cursor.execute(
+    """
+    CREATE TABLE station_summary (
+        station              TEXT PRIMARY KEY UNIQUE,
+        series               TEXT NOT NULL,
+        study                TEXT NOT NULL,
+        flow_class           TEXT NOT NULL,
+        study_type           TEXT NOT NULL,
+        number_of_dimensions INTEGER NOT NULL,
+        coordinate_system    TEXT NOT NULL,
+        geometry             TEXT DEFAULT NULL,
+        fully_developed      INTEGER NOT NULL,
+        {:s},
+        FOREIGN KEY(station) REFERENCES stations(identifier)
+    );
+    """.format( ",\n        ".join( value_columns ) )
+    )
+
+    cursor.execute(
+    """
+    INSERT INTO station_summary( station, series, study, flow_class,
+                                 study_type, number_of_dimensions,
+                                 coordinate_system, geometry,
+                                 fully_developed )
+    SELECT s.identifier, s.series, s.study, st.flow_class, st.study_type,
+           se.number_of_dimensions, se.coordinate_system, se.geometry,
+           coalesce( s.previous_streamwise_station=s.next_streamwise_station, 0 )
+    FROM stations AS s
+    JOIN studies AS st ON st.identifier=s.study
+    JOIN series  AS se ON se.identifier=s.series;
+    """
+    )
+
+    for column, quantity, averaging_system, label in summary_columns():
+        if ( label == None ):
             cursor.execute(
             """
-            SELECT point
-            FROM point_values
-            WHERE point LIKE ? AND quantity=? AND outlier=0
-            INTERSECT
-            SELECT point
-            FROM point_values
-            WHERE point LIKE ? AND quantity=? AND outlier=0
-            ORDER BY point;
-            """,
-            (
-                sanitize_identifier(station)+'%',
-                str(quantity1),
-                sanitize_identifier(station)+'%',
-                str(quantity2),
-            )
+            UPDATE station_summary
+            SET ( {0:s}, {0:s}_uncertainty ) = (
+                SELECT station_value, station_uncertainty
+                FROM station_values
+                WHERE station=station_summary.station AND quantity=?
+                  AND averaging_system IS ? AND outlier=0
+                ORDER BY mt_set
+                LIMIT 1
+            );
+            """.format( column ),
+            ( str(quantity), averaging_system, )
             )
         else:
-            # Only the second averaging system is specified.
             cursor.execute(
             """
-            SELECT point
-            FROM point_values
-            WHERE point LIKE ? AND quantity=? AND outlier=0
-            INTERSECT
-            SELECT point
-            FROM point_values
-            WHERE point LIKE ? AND quantity=? AND averaging_system=? AND outlier=0
-            ORDER BY point;
-            """,
-            (
-                sanitize_identifier(station)+'%',
-                str(quantity1),
-                sanitize_identifier(station)+'%',
-                str(quantity2),
-                str(averaging_system2),
-            )
+            UPDATE station_summary
+            SET ( {0:s}, {0:s}_uncertainty ) = (
+                SELECT v.point_value, v.point_uncertainty
+                FROM points AS p
+                JOIN point_values AS v ON v.point=p.identifier
+                WHERE p.station=station_summary.station AND p.point_label=?
+                  AND v.quantity=? AND v.averaging_system IS ?
+                  AND v.outlier=0
+                ORDER BY p.identifier, v.mt_set
+                LIMIT 1
+            );
+            """.format( column ),
+            ( str(label), str(quantity), averaging_system, )
             )
-    else:
-        if ( averaging_system2 == None ):
-            # Only the first averaging system is specified.
+
+    for column, quantity, label in summary_count_columns():
+        if ( label == None ):
             cursor.execute(
             """
-            SELECT point
-            FROM point_values
-            WHERE point LIKE ? AND quantity=? AND averaging_system=? AND outlier=0
-            INTERSECT
-            SELECT point
-            FROM point_values
-            WHERE point LIKE ? AND quantity=? AND outlier=0
-            ORDER BY point;
-            """,
-            (
-                sanitize_identifier(station)+'%',
-                str(quantity1),
-                str(averaging_system1),
-                sanitize_identifier(station)+'%',
-                str(quantity2),
-            )
+            UPDATE station_summary
+            SET {:s} = coalesce( (
+                SELECT count(*) AS n
+                FROM station_values
+                WHERE station=station_summary.station AND quantity=?
+                  AND outlier=0
+                GROUP BY averaging_system
+                ORDER BY n DESC
+                LIMIT 1
+            ), 0 );
+            """.format( column ),
+            ( str(quantity), )
             )
         else:
-            # Both averaging systems are specified.
             cursor.execute(
             """
-            SELECT point
-            FROM point_values
-            WHERE point LIKE ? AND quantity=? AND averaging_system=? AND outlier=0
-            INTERSECT
-            SELECT point
-            FROM point_values
-            WHERE point LIKE ? AND quantity=? AND averaging_system=? AND outlier=0
-            ORDER BY point;
-            """,
-            (
-                sanitize_identifier(station)+'%',
-                str(quantity1),
-                str(averaging_system1),
-                sanitize_identifier(station)+'%',
-                str(quantity2),
-                str(averaging_system2),
-            )
+            UPDATE station_summary
+            SET {:s} = coalesce( (
+                SELECT count(*) AS n
+                FROM points AS p
+                JOIN point_values AS v ON v.point=p.identifier
+                WHERE p.station=station_summary.station AND p.point_label=?
+                  AND v.quantity=? AND v.outlier=0
+                GROUP BY v.averaging_system
+                ORDER BY n DESC
+                LIMIT 1
+            ), 0 );
+            """.format( column ),
+            ( str(label), str(quantity), )
             )
 
-    results = cursor.fetchall()
-    points = []
-    for result in results:
-        points.append( result[0] )
-    n_points = len(points)
+    cursor.execute(
+    """
+    CREATE INDEX station_summary_by_class
+    ON station_summary( flow_class, study_type );
+    """
+    )
+    for column, quantity, averaging_system, label in summary_columns():
+        cursor.execute(
+        """
+        CREATE INDEX station_summary_by_{0:s}
+        ON station_summary( {0:s} );
+        """.format( column )
+        )
 
-    profile1 = []
-    profile2 = []
-    for point in points:
-        profile1.append( get_point_value(
-            cursor,
-            point,
-            quantity1,
-        ) )
-        profile2.append( get_point_value(
-            cursor,
-            point,
-            quantity2,
+    cursor.execute( "ANALYZE station_summary;" )
+
+# Builds a query that selects stations by the properties of their studies,
+# series, and stations and by the values of their quantities.  Each method
+# adds one condition and returns the query itself, so that the conditions can
+# be chained:
+#
+#     stations = sd.StationQuery().flow_class( sd.DUCT_FLOW_CLASS ) \
+#                .station_value( sd.Q_BULK_MACH_NUMBER, 0.0, 0.3 )     \
+#                .fetch( cursor )
+#
+# The studies and series are joined to the stations, and each condition on a
+# value becomes an IN subquery that the indexes created by create_indexes.py
+# cover, so SQLite can start from whichever condition selects the fewest
+# stations rather than evaluating every condition in full and intersecting
+# the results.  The bounds on the values are inclusive unless stated
+# otherwise, and either bound can be None.  Outliers never satisfy a
+# condition on a value.
+#
+# If summary is True, the query selects from the station summary instead.
+# Conditions on the summarized quantities then become range conditions on
+# its columns (a value for any averaging system satisfies them), and only the
+# other conditions still need subqueries.  The station summary only holds one
+# value for each quantity and averaging system, so for the stations that have
+# several values that are not outliers (according to the count columns), the
+# condition falls back to the same subquery as without the summary.  Both
+# forms therefore always select the same stations.
+class StationQuery:
+    def flow_class( self, flow_class ):
+        return self.where(
+            "{:s}.flow_class=?".format( self.alias( "st" ) ),
+            str(flow_class),
+        )
+
+    def study_type( self, study_type ):
+        return self.where(
+            "{:s}.study_type=?".format( self.alias( "st" ) ),
+            str(study_type),
+        )
+
+    def number_of_dimensions( self, number_of_dimensions ):
+        return self.where(
+            "{:s}.number_of_dimensions=?".format( self.alias( "se" ) ),
+            int(number_of_dimensions),
+        )
+
+    def coordinate_system( self, coordinate_system ):
+        return self.where(
+            "{:s}.coordinate_system=?".format( self.alias( "se" ) ),
+            str(coordinate_system),
+        )
+
+    def geometry( self, geometry ):
+        return self.where(
+            "{:s}.geometry=?".format( self.alias( "se" ) ),
+            str(geometry),
+        )
+
+    # The previous streamwise station of a fully-developed station is the
+    # next streamwise station too.
+    def fully_developed( self ):
+        if ( self.summary ):
+            return self.where( "sm.fully_developed=1" )
+        return self.where(
+            "s.previous_streamwise_station=s.next_streamwise_station"
+        )
+
+    def station_value( self, quantity, minimum=None, maximum=None, \
+                       include_minimum=True, include_maximum=True, ):
+        bounds, parameters = self.bounds(
+            "v.station_value",
+            minimum,
+            maximum,
+            include_minimum,
+            include_maximum,
+        )
+        condition = """
+            {:s} IN (
+                SELECT v.station
+                FROM station_values AS v
+                WHERE v.quantity=? AND v.outlier=0{:s}
+            )
+            """.format( self.station_column(), bounds )
+        parameters = [ str(quantity) ] + parameters
+        if ( self.summary and quantity in SUMMARY_STATION_QUANTITIES ):
+            return self.summary_value(
+                SUMMARY_STATION_QUANTITIES[quantity],
+                minimum,
+                maximum,
+                include_minimum,
+                include_maximum,
+                condition,
+                parameters,
+            )
+        return self.where( condition, *parameters )
+
+    # A condition on the values at any point in the station, or only at the
+    # points with a given label if the label is not None.
+    def point_value( self, quantity, minimum=None, maximum=None, \
+                     include_minimum=True, include_maximum=True, \
+                     label=None, ):
+        bounds, parameters = self.bounds(
+            "v.point_value",
+            minimum,
+            maximum,
+            include_minimum,
+            include_maximum,
+        )
+        label_condition = ""
+        label_parameters = []
+        if ( label != None ):
+            label_condition  = " AND p.point_label=?"
+            label_parameters = [ str(label) ]
+        condition = """
+            {:s} IN (
+                SELECT p.station
+                FROM point_values AS v
+                JOIN points AS p ON p.identifier=v.point{:s}
+                WHERE v.quantity=? AND v.outlier=0{:s}
+            )
+            """.format( self.station_column(), label_condition, bounds )
+        parameters = label_parameters + [ str(quantity) ] + parameters
+        if ( self.summary and label == WALL_POINT_LABEL \
+             and quantity in SUMMARY_WALL_QUANTITIES ):
+            return self.summary_value(
+                SUMMARY_WALL_QUANTITIES[quantity],
+                minimum,
+                maximum,
+                include_minimum,
+                include_maximum,
+                condition,
+                parameters,
+            )
+        return self.where( condition, *parameters )
+
+    def labeled_value( self, label, quantity, minimum=None, maximum=None, \
+                       include_minimum=True, include_maximum=True, ):
+        return self.point_value(
+            quantity,
+            minimum,
+            maximum,
+            include_minimum=include_minimum,
+            include_maximum=include_maximum,
+            label=label,
+        )
+
+    # The summary columns decide the condition for the stations with at most
+    # one value for each averaging system, and the subquery given decides it
+    # for the rest.
+    def summary_value( self, column, minimum, maximum, include_minimum, \
+                       include_maximum, subquery, subquery_parameters ):
+        conditions = []
+        parameters = []
+        for averaging_system in SUMMARY_AVERAGING_SYSTEMS:
+            summary_column = "sm."+column \
+                           + SUMMARY_AVERAGING_SYSTEMS[averaging_system]
+            bounds, bound_parameters = self.bounds(
+                summary_column,
+                minimum,
+                maximum,
+                include_minimum,
+                include_maximum,
+            )
+            conditions.append( "( {:s} IS NOT NULL{:s} )".format(
+                summary_column,
+                bounds,
+            ) )
+            parameters.extend( bound_parameters )
+        conditions.append( "( sm.{:s}_count > 1 AND {:s} )".format(
+            column,
+            subquery.strip(),
         ) )
+        parameters.extend( subquery_parameters )
+        return self.where(
+            "( {:s} )".format( " OR ".join( conditions ) ),
+            *parameters,
+        )
 
-    return np.array(profile1), np.array(profile2)
+    def bounds( self, column, minimum, maximum, include_minimum, \
+                include_maximum ):
+        bounds     = ""
+        parameters = []
+        if ( minimum != None ):
+            bounds += " AND {:s}{:s}?".format(
+                column,
+                ">=" if include_minimum else ">",
+            )
+            parameters.append( float(minimum) )
+        if ( maximum != None ):
+            bounds += " AND {:s}{:s}?".format(
+                column,
+                "<=" if include_maximum else "<",
+            )
+            parameters.append( float(maximum) )
+        return bounds, parameters
+
+    def alias( self, table ):
+        if ( self.summary ):
+            return "sm"
+        return table
+
+    def station_column( self ):
+        if ( self.summary ):
+            return "sm.station"
+        return "s.identifier"
+
+    def where( self, condition, *parameters ):
+        self.conditions.append( condition.strip() )
+        self.parameters.extend( parameters )
+        return self
+
+    def sql( self ):
+        conditions = " AND ".join( self.conditions )
+        if ( len(self.conditions) == 0 ):
+            conditions = "1"
+        if ( self.summary ):
+            return """
+            SELECT sm.station
+            FROM station_summary AS sm
+            WHERE {:s}
+            ORDER BY sm.station;
+            """.format( conditions ), tuple(self.parameters)
+        return """
+        SELECT s.identifier
+        FROM stations AS s
+        JOIN studies AS st ON st.identifier=s.study
+        JOIN series  AS se ON se.identifier=s.series
+        WHERE {:s}
+        ORDER BY s.identifier;
+        """.format( conditions ), tuple(self.parameters)
+
+    def fetch( self, cursor ):
+        cursor.execute( *self.sql() )
+        stations = []
+        for result in cursor.fetchall():
+            stations.append( str(result[0]) )
+        return stations
+
+    def __init__( self, summary=False ):
+        self.summary    = summary
+        self.conditions = []
+        self.parameters = []
 
 def locate_labeled_point( cursor, station, label ):
+    cache = labeled_point_cache( cursor )
+    key   = ( sanitize_identifier( station ), str(label) )
+    if ( cache != None and key in cache ):
+        return cache[key]
+
+    lower_bound, upper_bound = identifier_range( station )
     cursor.execute(
     """
     SELECT identifier
     FROM points
-    WHERE identifier
-    LIKE ? AND point_label=?
+    WHERE identifier >= ? AND identifier < ? AND point_label=?
     ORDER BY identifier
     LIMIT 1;
     """,
     (
-        sanitize_identifier(station)+'%',
+        lower_bound,
+        upper_bound,
         str(label),
     )
     )
-    result = cursor.fetchone()
-    return result[0]
+    point = cursor.fetchone()[0]
+    if ( cache != None ):
+        cache[key] = point
+    return point
 
 def set_labeled_value( cursor, station, quantity, label, value,          \
                        averaging_system=None, measurement_techniques=[], \
@@ -1280,13 +3001,86 @@ def get_working_fluid_name( cursor, series ):
                     name += " and "
             return name
 
-def integrate_using_trapezoid_rule( x, f, F0=sdfloat(0.0,0.0) ):
-    F = F0
-    for i in range(len(x)-1):
-        F += 0.5 * ( x[i+1] - x[i] ) * ( f[i+1] + f[i] )
-    return F
+# The uncertainties package tracks the correlations between ufloats (and arrays
+# of them), so that an integrand calculated from the coordinates, like u*r for
+# the volumetric flow rate of a pipe, stays correlated with them.  SDArrays and
+# ordinary arrays do not, and a ufloat with no uncertainty contributes nothing.
+def tracks_correlations( value ):
+    if ( isinstance( value, SDArray ) ):
+        return False
+    elif ( hasattr( value, "nominal_value" ) ):
+        return value.s != 0.0
+    else:
+        return np.asarray( value ).dtype == object
 
-def extract_element_counts( formula ):
+# The trapezoid rule is a weighted sum of the integrand, and the weights depend
+# only on the coordinates, so the uncertainty of the integral follows directly
+# from the partial derivatives with respect to each point.  This assumes that
+# the points are uncorrelated, so values that track their correlations are
+# instead integrated one interval at a time with the uncertainties package.
+#
+# The cumulative integral F[k] is the integral from x[0] to x[k], so that F[0]
+# is F0 and F[-1] is the full integral.  For k > 0, the derivatives with
+# respect to the points j < k are the same for every later k, which means that
+# their contributions to the variance are a cumulative sum.  Only the
+# contribution of point k itself, which has only one neighboring interval,
+# needs to be added separately.
+def cumulatively_integrate_using_trapezoid_rule( x, f, F0=None ):
+    if ( F0 is None ):
+        F0 = sdfloat( 0.0, 0.0 )
+    if ( tracks_correlations( x ) or tracks_correlations( f ) or \
+         tracks_correlations( F0 ) ):
+        if ( isinstance( x, SDArray ) ):
+            x = x.to_uarray()
+        if ( isinstance( f, SDArray ) ):
+            f = f.to_uarray()
+        F = [ F0 ]
+        for i in range(len(x)-1):
+            F.append( F[-1] + 0.5 * ( x[i+1] - x[i] ) * ( f[i+1] + f[i] ) )
+        return np.array( F, dtype=object )
+
+    x_nominal,  x_std_dev  = split_array( x  )
+    f_nominal,  f_std_dev  = split_array( f  )
+    F0_nominal, F0_std_dev = split_array( F0 )
+
+    dx      = x_nominal[1:] - x_nominal[:-1]
+    f_sum   = f_nominal[1:] + f_nominal[:-1]
+    F       = np.zeros( len(x_nominal) )
+    F[0]    = F0_nominal
+    F[1:]   = F0_nominal + np.cumsum( 0.5 * dx * f_sum )
+
+    f_weights      = 0.5 * dx
+    f_weights[1:] += 0.5 * dx[:-1]
+    x_weights      = -0.5 * f_sum
+    x_weights[1:] +=  0.5 * f_sum[:-1]
+
+    variance      = np.zeros( len(x_nominal) )
+    variance[:]   = propagate_uncertainty( ( 1.0, ), ( F0_std_dev, ) )**2.0
+    variance[1:] += np.cumsum(
+        propagate_uncertainty(
+            ( f_weights,      x_weights,      ),
+            ( f_std_dev[:-1], x_std_dev[:-1], ),
+        )**2.0
+    )
+    variance[1:] += propagate_uncertainty(
+        ( 0.5 * dx,       0.5 * f_sum,    ),
+        ( f_std_dev[1:],  x_std_dev[1:],  ),
+    )**2.0
+
+    return SDArray( F, variance**0.5 )
+
+def integrate_using_trapezoid_rule( x, f, F0=None ):
+    if ( F0 is None ):
+        F0 = sdfloat( 0.0, 0.0 )
+    if ( len(x) == 0 ):
+        return F0
+    return cumulatively_integrate_using_trapezoid_rule( x, f, F0=F0 )[-1]
+
+# Formulas are parsed once and the results are kept, since the same few
+# formulas (the components of air, for example) are used again and again.
+# The cached result is a tuple of pairs so that callers cannot modify it.
+@functools.lru_cache( maxsize=1024 )
+def parse_molecular_formula( formula ):
     element_counts = {}
 
     fragments = []
@@ -1310,24 +3104,37 @@ def extract_element_counts( formula ):
             count   = int(fragment[i:])
         element_counts[element] = count
 
-    return element_counts
+    return tuple( element_counts.items() )
+
+def extract_element_counts( formula ):
+    return dict( parse_molecular_formula( formula ) )
+
+# Loads the atomic weights of all of the elements at once.  Connections opened
+# by open_database keep them, so the elements table is only read once.
+def get_atomic_weights( cursor ):
+    atomic_weights = getattr( cursor.connection, "atomic_weights", None )
+    if ( atomic_weights != None ):
+        return atomic_weights
+
+    cursor.execute(
+    """
+    SELECT element_symbol, atomic_weight
+    FROM elements;
+    """
+    )
+    atomic_weights = {}
+    for result in cursor.fetchall():
+        atomic_weights[str(result[0])] = float(result[1])
+
+    if ( hasattr( cursor.connection, "atomic_weights" ) ):
+        cursor.connection.atomic_weights = atomic_weights
+    return atomic_weights
 
 def calculate_molar_mass_of_molecular_formula( cursor, formula ):
-    element_counts = extract_element_counts( formula )
-    molar_mass      = 0.0
-    for element in element_counts:
-        count = element_counts[element]
-        cursor.execute(
-        """
-        SELECT atomic_weight
-        FROM elements
-        WHERE element_symbol=?;
-        """,
-        ( element, )
-        )
-        result = cursor.fetchone()
-        atomic_weight = float(result[0])
-        molar_mass += count * 1.0e-3 * atomic_weight
+    atomic_weights = get_atomic_weights( cursor )
+    molar_mass     = 0.0
+    for element, count in parse_molecular_formula( formula ):
+        molar_mass += count * 1.0e-3 * atomic_weights[element]
     return molar_mass
 
 def mark_station_as_periodic( cursor, station, \
@@ -1420,3 +3227,48 @@ def add_note( cursor, filename ):
     """
     )
     return int(cursor.fetchone()[0])
+
+# Copies all of the data from another database with the same tables into the
+# database.  Each database numbers its notes starting from 1, so the notes
+# being copied are renumbered to follow the existing notes.
+#
+# A database cannot be attached or detached inside of a transaction, so this
+# commits the copied data.
+def merge_database( cursor, filename ):
+    cursor.connection.commit()
+    cursor.execute( "ATTACH DATABASE ? AS staging;", ( str(filename), ) )
+
+    cursor.execute(
+    """
+    SELECT coalesce( max(note_id), 0 )
+    FROM main.notes;
+    """
+    )
+    note_offset = int(cursor.fetchone()[0])
+
+    for table in DATA_TABLES:
+        cursor.execute( "PRAGMA main.table_info({:s});".format( table ) )
+        columns    = []
+        selections = []
+        for result in cursor.fetchall():
+            column = str(result[1])
+            columns.append( column )
+            if ( column == "note" or column == "note_id" ):
+                selections.append( "{:s}+{:d}".format( column, note_offset ) )
+            else:
+                selections.append( column )
+
+        cursor.execute(
+        """
+        INSERT INTO main.{0:s}( {1:s} )
+        SELECT {2:s}
+        FROM staging.{0:s};
+        """.format(
+            table,
+            ", ".join( columns ),
+            ", ".join( selections ),
+        )
+        )
+
+    cursor.connection.commit()
+    cursor.execute( "DETACH DATABASE staging;" )
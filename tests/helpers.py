@@ -0,0 +1,29 @@
+# Copyright (C) 2020-2021 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import subprocess
+import sys
+
+source_directory = os.path.join(
+    os.path.dirname( os.path.abspath( __file__ ) ),
+    os.pardir,
+    "src",
+)
+sys.path.insert( 0, source_directory )
+
+import sheardata as sd
+
+# Creates an empty database using create_tables.py, which must run from the
+# source directory, and opens it in ingest mode.
+def create_database( directory ):
+    database = os.path.join( directory, "sheardata.db" )
+    subprocess.run(
+        [ sys.executable, "-B", "create_tables.py", database, ],
+        cwd=source_directory,
+        env=dict( os.environ, PYTHONPATH=source_directory ),
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    return sd.open_database( database, sd.INGEST_DATABASE_MODE )
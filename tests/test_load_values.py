@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import math
+import tempfile
+import unittest
+
+import helpers
+import sheardata as sd
+
+# Checks that load_station, load_station_values, and load_labeled_values
+# return the same values as get_point_value, get_station_value, and
+# get_labeled_value, on a small database with more stations than fit in one
+# chunk and with some values missing.  Missing values must be NaN.
+#
+# Run this from any directory:
+#
+#     python3 -m unittest discover tests
+
+flow_class   = sd.DUCT_FLOW_CLASS
+year         = 2021
+study_number = 1
+
+number_of_stations = sd.QUERY_CHUNK_SIZE + 3
+number_of_points   = 3
+
+averaging_systems = [
+    sd.ANY_AVERAGING_SYSTEM,
+    sd.UNWEIGHTED_AVERAGING_SYSTEM,
+    sd.DENSITY_WEIGHTED_AVERAGING_SYSTEM,
+]
+
+class TestLoadValues( unittest.TestCase ):
+    def assertSameValue( self, actual, expected ):
+        self.assertEqual( actual.n, expected.n )
+        if ( math.isnan( expected.s ) ):
+            self.assertTrue( math.isnan( actual.s ) )
+        else:
+            self.assertEqual( actual.s, expected.s )
+
+    def assertMissing( self, actual ):
+        self.assertTrue( math.isnan( actual.n ) )
+        self.assertTrue( math.isnan( actual.s ) )
+
+    # Returns whether a value was set for this key in this averaging system.
+    def has_value( self, key, quantity, averaging_system ):
+        if ( averaging_system == sd.ANY_AVERAGING_SYSTEM ):
+            return any( ( key, quantity, avg_sys ) in self.values
+                        for avg_sys in averaging_systems[1:] )
+        else:
+            return ( key, quantity, averaging_system ) in self.values
+
+    def test_load_station( self ):
+        for station in [ self.stations[0], self.stations[3],
+                         self.stations[-1], ]:
+            for averaging_system in averaging_systems:
+                with self.subTest( station=station,
+                                   averaging_system=averaging_system ):
+                    profile = sd.load_station(
+                        self.cursor,
+                        station,
+                        quantities=self.point_quantities,
+                        averaging_system=averaging_system,
+                    )
+                    self.assertEqual( list( profile.point_numbers ),
+                                      list( range( 1, number_of_points+1 ) ) )
+
+                    for quantity in self.point_quantities:
+                        for i, point_number in enumerate( profile.point_numbers ):
+                            point = sd.identify_point(
+                                *sd.parse_identifier( station ).fields(),
+                                point_number,
+                            )
+                            if ( self.has_value( point, quantity,
+                                                 averaging_system ) ):
+                                self.assertSameValue(
+                                    profile[quantity][i],
+                                    sd.get_point_value(
+                                        self.cursor,
+                                        point,
+                                        quantity,
+                                        averaging_system=averaging_system,
+                                    ),
+                                )
+                            else:
+                                self.assertMissing( profile[quantity][i] )
+
+    def test_load_station_quantities( self ):
+        # A quantity without any values is still loaded when it is requested.
+        profile = sd.load_station(
+            self.cursor,
+            self.stations[1],
+            quantities=[ sd.Q_STREAMWISE_VELOCITY, sd.Q_MASS_DENSITY, ],
+        )
+        self.assertEqual( profile.quantities(),
+                          sorted( [ sd.Q_STREAMWISE_VELOCITY,
+                                    sd.Q_MASS_DENSITY, ] ) )
+        for i in range( number_of_points ):
+            self.assertMissing( profile[sd.Q_MASS_DENSITY][i] )
+
+        # Otherwise only the quantities found are loaded.
+        profile = sd.load_station( self.cursor, self.stations[1] )
+        self.assertEqual( profile.quantities(),
+                          sorted( self.point_quantities ) )
+
+    def test_load_station_values( self ):
+        for averaging_system in averaging_systems:
+            with self.subTest( averaging_system=averaging_system ):
+                values = sd.load_station_values(
+                    self.cursor,
+                    self.stations,
+                    self.station_quantities,
+                    averaging_system=averaging_system,
+                )
+                for quantity in self.station_quantities:
+                    self.assertEqual( len( values[quantity] ),
+                                      number_of_stations )
+                    for i, station in enumerate( self.stations ):
+                        if ( self.has_value( station, quantity,
+                                             averaging_system ) ):
+                            self.assertSameValue(
+                                values[quantity][i],
+                                sd.get_station_value(
+                                    self.cursor,
+                                    station,
+                                    quantity,
+                                    averaging_system=averaging_system,
+                                ),
+                            )
+                        else:
+                            self.assertMissing( values[quantity][i] )
+
+    def test_load_labeled_values( self ):
+        for averaging_system in averaging_systems:
+            with self.subTest( averaging_system=averaging_system ):
+                values = sd.load_labeled_values(
+                    self.cursor,
+                    self.stations,
+                    self.point_quantities,
+                    sd.WALL_POINT_LABEL,
+                    averaging_system=averaging_system,
+                )
+                for quantity in self.point_quantities:
+                    for i, station in enumerate( self.stations ):
+                        wall_point = sd.locate_labeled_point(
+                            self.cursor,
+                            station,
+                            sd.WALL_POINT_LABEL,
+                        )
+                        if ( self.has_value( wall_point, quantity,
+                                             averaging_system ) ):
+                            self.assertSameValue(
+                                values[quantity][i],
+                                sd.get_labeled_value(
+                                    self.cursor,
+                                    station,
+                                    quantity,
+                                    sd.WALL_POINT_LABEL,
+                                    averaging_system=averaging_system,
+                                ),
+                            )
+                        else:
+                            self.assertMissing( values[quantity][i] )
+
+    # The same station may appear several times, and the results stay aligned
+    # with the stations given.
+    def test_repeated_stations( self ):
+        stations = [ self.stations[1], self.stations[0], self.stations[1], ]
+        values = sd.load_station_values(
+            self.cursor,
+            stations,
+            [ sd.Q_BULK_REYNOLDS_NUMBER, ],
+        )[sd.Q_BULK_REYNOLDS_NUMBER]
+        for i, station in enumerate( stations ):
+            self.assertSameValue(
+                values[i],
+                sd.get_station_value(
+                    self.cursor,
+                    station,
+                    sd.Q_BULK_REYNOLDS_NUMBER,
+                ),
+            )
+
+    def test_pivot_values( self ):
+        values = sd.pivot_values(
+            [ "a", "b", "a", "c", ],
+            [ "x", "y", ],
+            [
+                ( "a", "x", 1.0,  0.1,  ),
+                ( "a", "x", 2.0,  0.2,  ),
+                ( "b", "x", 3.0,  None, ),
+                ( "b", "y", 4.0,  0.4,  ),
+                ( "c", None, None, None, ),
+            ],
+        )
+        self.assertEqual( sorted( values ), [ "x", "y", ] )
+
+        # Only the first row for each key and quantity is kept.
+        self.assertSameValue( values["x"][0], sd.sdfloat( 1.0, 0.1 ) )
+        self.assertSameValue( values["x"][1], sd.sdfloat( 3.0, None ) )
+        self.assertSameValue( values["x"][2], sd.sdfloat( 1.0, 0.1 ) )
+        self.assertMissing(   values["x"][3] )
+        self.assertMissing(   values["y"][0] )
+        self.assertSameValue( values["y"][1], sd.sdfloat( 4.0, 0.4 ) )
+        self.assertMissing(   values["y"][2] )
+        self.assertMissing(   values["y"][3] )
+
+    def setUp( self ):
+        self.directory = tempfile.TemporaryDirectory()
+        self.conn      = helpers.create_database( self.directory.name )
+        self.cursor    = self.conn.cursor()
+
+        sd.add_study(
+            self.cursor,
+            flow_class=flow_class,
+            year=year,
+            study_number=study_number,
+            study_type=sd.DIRECT_NUMERICAL_SIMULATION_STUDY_TYPE,
+        )
+        sd.add_series(
+            self.cursor,
+            flow_class=flow_class,
+            year=year,
+            study_number=study_number,
+            series_number=1,
+            number_of_dimensions=2,
+            coordinate_system=sd.CYLINDRICAL_COORDINATE_SYSTEM,
+        )
+
+        self.station_quantities = [ sd.Q_BULK_REYNOLDS_NUMBER,
+                                    sd.Q_BULK_MACH_NUMBER, ]
+        self.point_quantities   = [ sd.Q_STREAMWISE_VELOCITY,
+                                    sd.Q_FANNING_FRICTION_FACTOR, ]
+
+        # The values set, keyed by the station or point, the quantity, and the
+        # averaging system.
+        self.values = {}
+
+        batch = sd.PointValueBatch()
+        self.stations = []
+        for station_number in range( 1, number_of_stations+1 ):
+            station = sd.add_station(
+                self.cursor,
+                flow_class=flow_class,
+                year=year,
+                study_number=study_number,
+                series_number=1,
+                station_number=station_number,
+            )
+            self.stations.append( station )
+
+            # Every third station lacks a bulk Reynolds number, and the bulk
+            # Mach number differs between the averaging systems.
+            if ( station_number % 3 != 0 ):
+                self.set_station_value( station, sd.Q_BULK_REYNOLDS_NUMBER,
+                                        sd.UNWEIGHTED_AVERAGING_SYSTEM,
+                                        sd.sdfloat( 1000.0 * station_number,
+                                                    10.0 ) )
+            self.set_station_value( station, sd.Q_BULK_MACH_NUMBER,
+                                    sd.UNWEIGHTED_AVERAGING_SYSTEM,
+                                    sd.sdfloat( 0.001 * station_number ) )
+            self.set_station_value( station, sd.Q_BULK_MACH_NUMBER,
+                                    sd.DENSITY_WEIGHTED_AVERAGING_SYSTEM,
+                                    sd.sdfloat( 0.002 * station_number,
+                                                0.0001 ) )
+
+            points = sd.add_points(
+                self.cursor,
+                station,
+                number_of_points,
+                { 1: sd.WALL_POINT_LABEL,
+                  number_of_points: sd.CENTER_LINE_POINT_LABEL, },
+            )
+
+            # The second point has no values, and every fourth station lacks a
+            # Fanning friction factor.
+            for point_number, point in enumerate( points, 1 ):
+                if ( point_number == 2 ):
+                    continue
+                velocity = 0.5 * ( point_number - 1 ) * station_number
+                self.set_point_value( batch, point, sd.Q_STREAMWISE_VELOCITY,
+                                      sd.UNWEIGHTED_AVERAGING_SYSTEM,
+                                      sd.sdfloat( velocity, 0.01 ) )
+                self.set_point_value( batch, point, sd.Q_STREAMWISE_VELOCITY,
+                                      sd.DENSITY_WEIGHTED_AVERAGING_SYSTEM,
+                                      sd.sdfloat( 1.1 * velocity ) )
+            if ( station_number % 4 != 0 ):
+                self.set_point_value( batch, points[0],
+                                      sd.Q_FANNING_FRICTION_FACTOR,
+                                      sd.UNWEIGHTED_AVERAGING_SYSTEM,
+                                      sd.sdfloat( 0.001 * station_number ) )
+        batch.flush( self.cursor )
+        self.conn.commit()
+
+    def set_station_value( self, station, quantity, averaging_system, value ):
+        sd.set_station_value(
+            self.cursor,
+            station,
+            quantity,
+            value,
+            averaging_system=averaging_system,
+        )
+        self.values[ ( station, quantity, averaging_system ) ] = value
+
+    def set_point_value( self, batch, point, quantity, averaging_system, \
+                         value ):
+        batch.set_point_value(
+            point,
+            quantity,
+            value,
+            averaging_system=averaging_system,
+        )
+        self.values[ ( point, quantity, averaging_system ) ] = value
+
+    def tearDown( self ):
+        self.conn.close()
+        self.directory.cleanup()
+
+if ( __name__ == "__main__" ):
+    unittest.main()
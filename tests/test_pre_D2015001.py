@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import unittest
+
+import helpers
+import numpy as np
+import sheardata as sd
+import pre_D2015001
+
+# Checks the quantities that pre_D2015001.py derives for whole profiles against
+# the same quantities calculated point by point with ufloats, as the script did
+# before, using finite uncertainties for every input.
+
+number_of_points = 5
+number_of_columns = 16
+
+def old_per_point_quantities( point, half_height, prandtl_number,      \
+                              heat_capacity_ratio, specific_gas_constant, \
+                              specific_isobaric_heat_capacity,          \
+                              wall_shear_stress, friction_velocity ):
+    (
+        distance_from_wall,
+        inner_layer_coordinate,
+        streamwise_velocity_uw,
+        streamwise_velocity_dw,
+        mass_density,
+        pressure,
+        temperature_uw,
+        temperature_dw,
+        dynamic_viscosity,
+        R_uu_dw,
+        R_vv_dw,
+        R_ww_dw,
+        R_uv_dw,
+        mass_density_autocovariance_uw,
+        pressure_autocovariance_uw,
+        temperature_autocovariance_dw,
+    ) = point
+
+    old = {}
+
+    old["outer_layer_coordinate"] =  distance_from_wall / half_height
+    old["kinematic_viscosity"]    =   dynamic_viscosity / mass_density
+    old["thermal_diffusivity"]    = old["kinematic_viscosity"] / prandtl_number
+    old["thermal_conductivity"]   = old["thermal_diffusivity"] * mass_density * specific_isobaric_heat_capacity
+    old["speed_of_sound_uw"]      = ( heat_capacity_ratio * specific_gas_constant * temperature_uw )**0.5
+    old["speed_of_sound_dw"]      = ( heat_capacity_ratio * specific_gas_constant * temperature_dw )**0.5
+
+    old["R_uu_plus_dw"] = R_uu_dw / friction_velocity**2.0
+    old["R_vv_plus_dw"] = R_vv_dw / friction_velocity**2.0
+    old["R_ww_plus_dw"] = R_ww_dw / friction_velocity**2.0
+    old["R_uv_plus_dw"] = R_uv_dw / friction_velocity**2.0
+
+    old["R_uu_star_dw"] = mass_density * R_uu_dw / wall_shear_stress
+    old["R_vv_star_dw"] = mass_density * R_vv_dw / wall_shear_stress
+    old["R_ww_star_dw"] = mass_density * R_ww_dw / wall_shear_stress
+    old["R_uv_star_dw"] = mass_density * R_uv_dw / wall_shear_stress
+
+    old["TKE_dw"]      = 0.5 * ( R_uu_dw + R_vv_dw + R_ww_dw )
+    old["TKE_plus_dw"] = old["TKE_dw"] / friction_velocity**2.0
+    old["TKE_star_dw"] = mass_density * old["TKE_dw"] / wall_shear_stress
+
+    old["normalized_mass_density_autocovariance_uw"] = mass_density_autocovariance_uw / mass_density
+    old["normalized_pressure_autocovariance_uw"]     =     pressure_autocovariance_uw / pressure
+    old["normalized_temperature_autocovariance_dw"]  =  temperature_autocovariance_dw / temperature_dw
+
+    return old
+
+class TestDerivedProfileQuantities( unittest.TestCase ):
+    def test_against_per_point_ufloats( self ):
+        random  = np.random.default_rng( 2015 )
+        nominal = random.uniform( 0.5, 2.0, ( number_of_points, number_of_columns ) )
+        std_dev = random.uniform( 0.01, 0.1, ( number_of_points, number_of_columns ) ) * nominal
+
+        heat_capacity_ratio   = sd.sdfloat( 1.4,    0.01 )
+        specific_gas_constant = sd.sdfloat( 287.0,  1.0  )
+        prandtl_number        = sd.sdfloat( 0.7,    0.02 )
+        half_height           = sd.sdfloat( 1.0,    0.0  )
+        wall_shear_stress     = sd.sdfloat( 0.005,  0.0002 )
+        friction_velocity     = sd.sdfloat( 0.06,   0.001 )
+
+        specific_isochoric_heat_capacity = specific_gas_constant / ( heat_capacity_ratio - 1.0 )
+        specific_isobaric_heat_capacity  = heat_capacity_ratio * specific_isochoric_heat_capacity
+
+        scalars = (
+            half_height,
+            prandtl_number,
+            heat_capacity_ratio,
+            specific_gas_constant,
+            specific_isobaric_heat_capacity,
+            wall_shear_stress,
+            friction_velocity,
+        )
+
+        profile = []
+        for j in range(number_of_columns):
+            profile.append( sd.SDArray( nominal[:,j], std_dev[:,j] ) )
+        derived = pre_D2015001.derive_profile_quantities( profile, *scalars )
+
+        for i in range(number_of_points):
+            point = []
+            for j in range(number_of_columns):
+                point.append( sd.sdfloat( nominal[i,j], std_dev[i,j] ) )
+            old = old_per_point_quantities( point, *scalars )
+
+            self.assertEqual( sorted(derived), sorted(old) )
+            for name in old:
+                value = derived[name][i]
+                with self.subTest( name=name, point=i ):
+                    self.assertAlmostEqual( value.n / old[name].n, 1.0, places=12 )
+                    self.assertAlmostEqual( value.s / old[name].s, 1.0, places=12 )
+
+if ( __name__ == "__main__" ):
+    unittest.main()
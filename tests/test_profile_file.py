@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import math
+import os
+import tempfile
+import unittest
+
+import helpers
+import sheardata as sd
+
+# Checks read_profile_file and load_profile_file on a small profile file,
+# including several ProfileColumns that read the same column of the file with
+# different scales, and checks that add_point and add_points store the same
+# rows.
+#
+# Run this from any directory:
+#
+#     python3 -m unittest discover tests
+
+flow_class   = sd.DUCT_FLOW_CLASS
+year         = 2021
+study_number = 1
+
+# The labels are quoted and contain commas and a "#", and the rows end with a
+# trailing comma and are followed by a blank row.
+profile_contents = """"y",  "u",   "T",  "Label",
+0.0,  0.0,   32.0, "wall, #1",
+0.5,  10.0,  50.0, "middle",
+1.0,  12.0,  212.0, "center, #3",
+
+"""
+
+class TestProfileFile( unittest.TestCase ):
+    def test_read_profile_file( self ):
+        y, u, temperature, labels = sd.read_profile_file(
+            self.filename,
+            [
+                sd.ProfileColumn( "y",                                                                   ),
+                sd.ProfileColumn( "u",     scale=1.0e-2,                                                 ),
+                sd.ProfileColumn( "T",     transform=lambda cell: sd.fahrenheit_to_kelvin( float(cell) ), ),
+                sd.ProfileColumn( "Label", transform=str,                                                ),
+            ],
+        )
+        self.assertEqual( list( y.nominal ), [ 0.0, 0.5, 1.0, ] )
+        self.assertEqual( list( u.nominal ), [ 0.0, 10.0e-2, 12.0e-2, ] )
+        for value, expected in zip( temperature.nominal,
+                                    [ 0.0, 10.0, 100.0, ] ):
+            self.assertAlmostEqual( value - sd.ABSOLUTE_ZERO, expected )
+        self.assertEqual( labels, [ "wall, #1", "middle", "center, #3", ] )
+
+        # The files do not give the uncertainties.
+        for values in [ y, u, temperature, ]:
+            self.assertTrue( all( math.isnan( std_dev )
+                                  for std_dev in values.std_dev ) )
+
+    def test_duplicate_columns( self ):
+        profile = sd.read_profile_file(
+            self.filename,
+            [
+                sd.ProfileColumn( "u",                ),
+                sd.ProfileColumn( "u", scale=1.0e-2,  ),
+                sd.ProfileColumn( 1,   scale=-1.0,    ),
+            ],
+        )
+        self.assertEqual( len(profile), 3 )
+        self.assertEqual( list( profile[0].nominal ), [ 0.0,  10.0,    12.0,   ] )
+        self.assertEqual( list( profile[1].nominal ), [ 0.0,  10.0e-2, 12.0e-2, ] )
+        self.assertEqual( list( profile[2].nominal ), [ -0.0, -10.0,   -12.0,  ] )
+
+    def test_load_profile_file( self ):
+        note = sd.add_note( self.cursor, self.note_filename )
+
+        batch = sd.PointValueBatch()
+        points, profile = sd.load_profile_file(
+            self.cursor,
+            self.station,
+            self.filename,
+            [
+                sd.ProfileColumn( "y", sd.Q_DISTANCE_FROM_WALL, ),
+                sd.ProfileColumn( "u", sd.Q_STREAMWISE_VELOCITY, averaging_system=sd.BOTH_AVERAGING_SYSTEMS, scale=1.0e-2, measurement_techniques=[sd.MT_CALCULATION], notes=[note], ),
+            ],
+            batch,
+            point_labels={ 1: sd.WALL_POINT_LABEL, 3: sd.CENTER_LINE_POINT_LABEL, },
+        )
+        batch.flush( self.cursor )
+
+        self.assertEqual( len(points), 3 )
+        self.assertEqual(
+            sd.get_labeled_value(
+                self.cursor,
+                self.station,
+                sd.Q_STREAMWISE_VELOCITY,
+                sd.CENTER_LINE_POINT_LABEL,
+                averaging_system=sd.DENSITY_WEIGHTED_AVERAGING_SYSTEM,
+            ).n,
+            12.0e-2,
+        )
+        for point, y, u in zip( points, profile[0], profile[1] ):
+            self.assertEqual(
+                sd.get_point_value(
+                    self.cursor,
+                    point,
+                    sd.Q_DISTANCE_FROM_WALL,
+                ).n,
+                y.n,
+            )
+            value = sd.get_point_value(
+                self.cursor,
+                point,
+                sd.Q_STREAMWISE_VELOCITY,
+                averaging_system=sd.UNWEIGHTED_AVERAGING_SYSTEM,
+            )
+            self.assertEqual( value.n, u.n )
+            self.assertTrue( math.isnan( value.s ) )
+
+        # Each column's measurement techniques and notes apply to each value
+        # in each averaging system.
+        for table in [ "point_values_mt", "point_value_notes", ]:
+            self.cursor.execute(
+            """
+            SELECT COUNT(*)
+            FROM {:s}
+            WHERE quantity=?;
+            """.format( table ),
+            (
+                sd.Q_STREAMWISE_VELOCITY,
+            )
+            )
+            self.assertEqual( self.cursor.fetchone()[0], 6 )
+
+    # An ordinary float is an unknown uncertainty for set_point_value, like
+    # sdfloat, but an exact value for set_point_values, like in an SDArray.
+    def test_point_value_batch( self ):
+        points = sd.add_points( self.cursor, self.station, 2 )
+        batch  = sd.PointValueBatch()
+        batch.set_point_value(  points[0], sd.Q_STREAMWISE_COORDINATE, 1.0, )
+        batch.set_point_values( points,    sd.Q_SPANWISE_COORDINATE,   1.0, )
+        self.assertEqual( len(batch), 3 )
+        batch.flush( self.cursor )
+
+        self.cursor.execute(
+        """
+        SELECT point, quantity, point_value, point_uncertainty
+        FROM point_values
+        ORDER BY point, quantity;
+        """
+        )
+        self.assertEqual(
+            self.cursor.fetchall(),
+            sorted( [
+                ( points[0], sd.Q_STREAMWISE_COORDINATE, 1.0, None, ),
+                ( points[0], sd.Q_SPANWISE_COORDINATE,   1.0, 0.0,  ),
+                ( points[1], sd.Q_SPANWISE_COORDINATE,   1.0, 0.0,  ),
+            ] ),
+        )
+
+    def test_add_point( self ):
+        note = sd.add_note( self.cursor, self.note_filename )
+
+        point = sd.add_point(
+            self.cursor,
+            flow_class=flow_class,
+            year=year,
+            study_number=study_number,
+            series_number=1,
+            station_number=1,
+            point_number=2,
+            point_label=sd.CENTER_LINE_POINT_LABEL,
+            outlier=True,
+            notes=[note],
+        )
+        points = sd.add_points(
+            self.cursor,
+            self.station,
+            1,
+            { 1: sd.WALL_POINT_LABEL, },
+            outlier=True,
+            notes=[note],
+        )
+        self.assertEqual( points, [ sd.identify_point( flow_class, year,   \
+            study_number, 1, 1, 1 ), ] )
+        self.assertEqual( point, sd.identify_point( flow_class, year,      \
+            study_number, 1, 1, 2 ) )
+
+        self.cursor.execute(
+        """
+        SELECT identifier, station, point_number, point_label, outlier
+        FROM points
+        ORDER BY identifier;
+        """
+        )
+        self.assertEqual(
+            self.cursor.fetchall(),
+            [
+                ( points[0], self.station, 1, sd.WALL_POINT_LABEL,        1, ),
+                ( point,     self.station, 2, sd.CENTER_LINE_POINT_LABEL, 1, ),
+            ],
+        )
+
+        self.cursor.execute(
+        """
+        SELECT point, note
+        FROM point_notes
+        ORDER BY point;
+        """
+        )
+        self.assertEqual(
+            self.cursor.fetchall(),
+            [ ( points[0], note, ), ( point, note, ), ],
+        )
+
+    def setUp( self ):
+        self.directory = tempfile.TemporaryDirectory()
+        self.conn      = helpers.create_database( self.directory.name )
+        self.cursor    = self.conn.cursor()
+
+        self.filename = os.path.join( self.directory.name, "profile.csv" )
+        with open( self.filename, "w" ) as profile_file:
+            profile_file.write( profile_contents )
+
+        self.note_filename = os.path.join( self.directory.name, "note.tex" )
+        with open( self.note_filename, "w" ) as note_file:
+            note_file.write( "A note.\n" )
+
+        sd.add_study(
+            self.cursor,
+            flow_class=flow_class,
+            year=year,
+            study_number=study_number,
+            study_type=sd.DIRECT_NUMERICAL_SIMULATION_STUDY_TYPE,
+        )
+        sd.add_series(
+            self.cursor,
+            flow_class=flow_class,
+            year=year,
+            study_number=study_number,
+            series_number=1,
+            number_of_dimensions=2,
+            coordinate_system=sd.CYLINDRICAL_COORDINATE_SYSTEM,
+        )
+        self.station = sd.add_station(
+            self.cursor,
+            flow_class=flow_class,
+            year=year,
+            study_number=study_number,
+            series_number=1,
+            station_number=1,
+        )
+
+    def tearDown( self ):
+        self.conn.close()
+        self.directory.cleanup()
+
+if ( __name__ == "__main__" ):
+    unittest.main()
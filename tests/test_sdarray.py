@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import math
+import operator
+import tempfile
+import unittest
+
+import helpers
+import numpy as np
+import uncertainties
+from uncertainties import unumpy as unp
+import sheardata as sd
+
+# Checks SDArray against the uncertainties package.  For independent inputs,
+# linear propagation is exact, so both must agree.
+
+a_nominal = np.array( [ 1.5, 2.0, 0.8, 3.1, ] )
+a_std_dev = np.array( [ 0.1, 0.3, 0.0, 0.2, ] )
+b_nominal = np.array( [ 0.7, 1.2, 2.5, 0.9, ] )
+b_std_dev = np.array( [ 0.05, 0.0, 0.2, 0.1, ] )
+
+binary_operators = [
+    operator.add,
+    operator.sub,
+    operator.mul,
+    operator.truediv,
+    operator.pow,
+]
+
+unary_operators = [
+    operator.neg,
+    operator.pos,
+    operator.abs,
+]
+
+class TestSDArray( unittest.TestCase ):
+    def assertMatches( self, value, expected ):
+        self.assertIsInstance( value, sd.SDArray )
+        np.testing.assert_allclose( value.nominal, unp.nominal_values( expected ), rtol=1.0e-12 )
+        np.testing.assert_allclose( value.std_dev, unp.std_devs(     expected ), rtol=1.0e-12, atol=1.0e-15 )
+
+    def operands( self ):
+        return sd.SDArray( a_nominal, a_std_dev ), \
+               sd.SDArray( b_nominal, b_std_dev ), \
+               unp.uarray( a_nominal, a_std_dev ), \
+               unp.uarray( b_nominal, b_std_dev )
+
+    def test_binary_operators( self ):
+        a, b, ua, ub = self.operands()
+        for op in binary_operators:
+            with self.subTest( operator=op.__name__ ):
+                self.assertMatches( op( a, b ), op( ua, ub ) )
+
+    def test_binary_operators_with_ordinary_arrays( self ):
+        a, b, ua, ub = self.operands()
+        for op in binary_operators:
+            with self.subTest( operator=op.__name__ ):
+                self.assertMatches( op( a, b_nominal ), op( ua, b_nominal ) )
+                self.assertMatches( op( b_nominal, a ), op( b_nominal, ua ) )
+                self.assertMatches( op( a, 2.5 ), op( ua, 2.5 ) )
+                self.assertMatches( op( 2.5, a ), op( 2.5, ua ) )
+
+    def test_binary_operators_with_ufloats( self ):
+        a, b, ua, ub = self.operands()
+        for op in binary_operators:
+            with self.subTest( operator=op.__name__ ):
+                c = sd.sdfloat( 1.3, 0.07 )
+                self.assertMatches( op( a, c ), op( ua, c ) )
+                self.assertMatches( op( c, a ), op( c, ua ) )
+
+    def test_unary_operators( self ):
+        a, b, ua, ub = self.operands()
+        for op in unary_operators:
+            with self.subTest( operator=op.__name__ ):
+                self.assertMatches( op( a ), op( ua ) )
+                self.assertMatches( op( -a ), op( -ua ) )
+
+    # Exact operands contribute nothing, even where the derivative with respect
+    # to them is not finite.
+    def test_exact_operands( self ):
+        root = sd.SDArray( [ 0.0, 4.0, ], [ 0.0, 0.1, ] )**0.5
+        np.testing.assert_array_equal( root.nominal, [ 0.0, 2.0,   ] )
+        np.testing.assert_array_equal( root.std_dev, [ 0.0, 0.025, ] )
+
+        length = sd.SDArray( [ math.inf, ], [ 0.0, ] ) / sd.SDArray( [ 4.0, ], [ 0.0, ] )
+        self.assertEqual( length.nominal[0], math.inf )
+        self.assertEqual( length.std_dev[0], 0.0 )
+
+        self.assertEqual( ( length * 2.0 ).std_dev[0], 0.0 )
+
+    # Values without an uncertainty (NULL in the database) have a NaN
+    # uncertainty, which stays NaN, as with the uncertainties package.
+    def test_nan_uncertainties( self ):
+        a = sd.SDArray( a_nominal )
+        self.assertTrue( np.all( np.isnan( a.std_dev ) ) )
+        for op in binary_operators:
+            with self.subTest( operator=op.__name__ ):
+                self.assertTrue( np.all( np.isnan( op( a, b_nominal ).std_dev ) ) )
+                self.assertTrue( np.all( np.isnan( op( a, sd.SDArray( b_nominal, b_std_dev ) ).std_dev ) ) )
+        self.assertTrue( math.isnan( ( sd.sdfloat( 1.0 ) * 0.0 ).s ) )
+        self.assertTrue( np.all( np.isnan( ( a * 0.0 ).std_dev ) ) )
+
+    def test_getitem_and_iteration( self ):
+        a, b, ua, ub = self.operands()
+
+        value = a[1]
+        self.assertIsInstance( value, uncertainties.UFloat )
+        self.assertEqual( value.n, a_nominal[1] )
+        self.assertEqual( value.s, a_std_dev[1] )
+
+        self.assertMatches( a[1:3], ua[1:3] )
+        self.assertEqual( len(a), len(a_nominal) )
+        self.assertEqual( a.shape, a_nominal.shape )
+
+        values = list(a)
+        self.assertEqual( len(values), len(a_nominal) )
+        for value, nominal, std_dev in zip( values, a_nominal, a_std_dev ):
+            self.assertIsInstance( value, uncertainties.UFloat )
+            self.assertEqual( value.n, nominal )
+            self.assertEqual( value.s, std_dev )
+
+    def test_round_trip( self ):
+        a, b, ua, ub = self.operands()
+        self.assertMatches( sd.to_sdarray( a.to_uarray() ), ua )
+        self.assertMatches( sd.to_sdarray( ua ), ua )
+        self.assertMatches( sd.to_sdarray( list(ua) ), ua )
+
+        exact = sd.to_sdarray( a_nominal )
+        np.testing.assert_array_equal( exact.nominal, a_nominal )
+        np.testing.assert_array_equal( exact.std_dev, np.zeros_like( a_nominal ) )
+
+    def test_split_array( self ):
+        a, b, ua, ub = self.operands()
+        for value in [ a, ua, ]:
+            nominal, std_dev = sd.split_array( value )
+            np.testing.assert_array_equal( nominal, a_nominal )
+            np.testing.assert_array_equal( std_dev, a_std_dev )
+        self.assertEqual( sd.split_array( sd.sdfloat( 2.0, 0.5 ) ), ( 2.0, 0.5, ) )
+
+class TestTwinProfiles( unittest.TestCase ):
+    def test_as_sdarray( self ):
+        for averaging_system in [ None, sd.UNWEIGHTED_AVERAGING_SYSTEM, ]:
+            with self.subTest( averaging_system=averaging_system ):
+                y, u = sd.get_twin_profiles(
+                    self.cursor,
+                    self.station,
+                    sd.Q_DISTANCE_FROM_WALL,
+                    sd.Q_STREAMWISE_VELOCITY,
+                    averaging_system2=averaging_system,
+                )
+                y_sdarray, u_sdarray = sd.get_twin_profiles(
+                    self.cursor,
+                    self.station,
+                    sd.Q_DISTANCE_FROM_WALL,
+                    sd.Q_STREAMWISE_VELOCITY,
+                    averaging_system2=averaging_system,
+                    as_sdarray=True,
+                )
+                for profile, sdarray in [ ( y, y_sdarray, ), ( u, u_sdarray, ), ]:
+                    self.assertIsInstance( sdarray, sd.SDArray )
+                    np.testing.assert_array_equal( sdarray.nominal, unp.nominal_values( profile ) )
+                    np.testing.assert_array_equal( sdarray.std_dev, unp.std_devs(     profile ) )
+
+        np.testing.assert_array_equal( y_sdarray.nominal, [ 0.0, 0.1, 0.2, ] )
+        np.testing.assert_array_equal( u_sdarray.nominal, [ 0.0, 0.5, 0.9, ] )
+        np.testing.assert_array_equal( u_sdarray.std_dev, [ 0.0, 0.02, 0.03, ] )
+        self.assertTrue( np.all( np.isnan( y_sdarray.std_dev ) ) )
+
+    def setUp( self ):
+        self.directory = tempfile.TemporaryDirectory()
+        self.conn      = helpers.create_database( self.directory.name )
+        self.cursor    = self.conn.cursor()
+
+        sd.add_study(
+            self.cursor,
+            flow_class=sd.DUCT_FLOW_CLASS,
+            year=2021,
+            study_number=1,
+            study_type=sd.DIRECT_NUMERICAL_SIMULATION_STUDY_TYPE,
+        )
+        sd.add_series(
+            self.cursor,
+            flow_class=sd.DUCT_FLOW_CLASS,
+            year=2021,
+            study_number=1,
+            series_number=1,
+            number_of_dimensions=2,
+            coordinate_system=sd.RECTANGULAR_COORDINATE_SYSTEM,
+        )
+        self.station = sd.add_station(
+            self.cursor,
+            flow_class=sd.DUCT_FLOW_CLASS,
+            year=2021,
+            study_number=1,
+            series_number=1,
+            station_number=1,
+        )
+        for point_number, y, u, u_uncertainty in [
+            ( 1, 0.0, 0.0, 0.0,  ),
+            ( 2, 0.1, 0.5, 0.02, ),
+            ( 3, 0.2, 0.9, 0.03, ),
+        ]:
+            point = sd.add_point(
+                self.cursor,
+                flow_class=sd.DUCT_FLOW_CLASS,
+                year=2021,
+                study_number=1,
+                series_number=1,
+                station_number=1,
+                point_number=point_number,
+            )
+            sd.set_point_value( self.cursor, point, sd.Q_DISTANCE_FROM_WALL,   sd.sdfloat( y ), )
+            sd.set_point_value( self.cursor, point, sd.Q_STREAMWISE_VELOCITY, sd.sdfloat( u, u_uncertainty ), averaging_system=sd.UNWEIGHTED_AVERAGING_SYSTEM, )
+
+    def tearDown( self ):
+        self.conn.close()
+        self.directory.cleanup()
+
+if ( __name__ == "__main__" ):
+    unittest.main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import tempfile
+import unittest
+
+import helpers
+import sheardata as sd
+
+# Checks that StationQuery selects the same stations with and without the
+# station summary, including for a station that has several values (that are
+# not outliers) for the same quantity and averaging system, which the summary
+# columns alone cannot represent.
+#
+# Run this from any directory:
+#
+#     python3 -m unittest discover tests
+
+flow_class   = sd.DUCT_FLOW_CLASS
+year         = 2021
+study_number = 1
+
+class TestStationSummary( unittest.TestCase ):
+    def add_station( self, station_number, bulk_reynolds_numbers, \
+                     fanning_friction_factors ):
+        station = sd.add_station(
+            self.cursor,
+            flow_class=flow_class,
+            year=year,
+            study_number=study_number,
+            series_number=1,
+            station_number=station_number,
+        )
+
+        # Each bulk Reynolds number comes from a different measurement
+        # technique set.
+        for mt_set, bulk_reynolds_number in enumerate( bulk_reynolds_numbers, 1 ):
+            sd.set_station_value(
+                self.cursor,
+                station,
+                sd.Q_BULK_REYNOLDS_NUMBER,
+                sd.sdfloat( bulk_reynolds_number, 0.0 ),
+                averaging_system=sd.UNWEIGHTED_AVERAGING_SYSTEM,
+                mt_set=mt_set,
+            )
+
+        # Each Fanning friction factor is at a different point labeled as the
+        # wall.
+        for point_number, fanning_friction_factor in enumerate( \
+            fanning_friction_factors, 1 ):
+            point = sd.add_point(
+                self.cursor,
+                flow_class=flow_class,
+                year=year,
+                study_number=study_number,
+                series_number=1,
+                station_number=station_number,
+                point_number=point_number,
+                point_label=sd.WALL_POINT_LABEL,
+            )
+            sd.set_point_value(
+                self.cursor,
+                point,
+                sd.Q_FANNING_FRICTION_FACTOR,
+                sd.sdfloat( fanning_friction_factor, 0.0 ),
+                averaging_system=sd.UNWEIGHTED_AVERAGING_SYSTEM,
+            )
+
+        return station
+
+    def fetch_both( self, build ):
+        stations = build( sd.StationQuery( summary=False ) ).fetch( self.cursor )
+        summary  = build( sd.StationQuery( summary=True  ) ).fetch( self.cursor )
+        self.assertEqual( stations, summary )
+        return stations
+
+    def test_station_values( self ):
+        for minimum, maximum, expected in [
+            ( 4000.0, 6000.0, [ self.multiple_station, ], ),
+            (  500.0, 1500.0, [ self.multiple_station, ], ),
+            ( 2000.0, 4000.0, [ self.single_station,   ], ),
+            (  500.0, 6000.0, [ self.multiple_station,
+                                self.single_station,   ], ),
+            ( 7000.0, 9000.0, [], ),
+        ]:
+            stations = self.fetch_both(
+                lambda query: query.station_value(
+                    sd.Q_BULK_REYNOLDS_NUMBER,
+                    minimum,
+                    maximum,
+                )
+            )
+            self.assertEqual( stations, expected )
+
+    def test_wall_values( self ):
+        for minimum, maximum, expected in [
+            ( 0.015, 0.025, [ self.multiple_station, ], ),
+            ( 0.005, 0.015, [ self.multiple_station, ], ),
+            ( 0.025, 0.035, [ self.single_station,   ], ),
+            ( 0.040, 0.050, [], ),
+        ]:
+            stations = self.fetch_both(
+                lambda query: query.labeled_value(
+                    sd.WALL_POINT_LABEL,
+                    sd.Q_FANNING_FRICTION_FACTOR,
+                    minimum,
+                    maximum,
+                )
+            )
+            self.assertEqual( stations, expected )
+
+    def test_summary_counts( self ):
+        self.cursor.execute(
+        """
+        SELECT station, bulk_reynolds_number_count,
+               wall_fanning_friction_factor_count
+        FROM station_summary
+        ORDER BY station;
+        """
+        )
+        self.assertEqual(
+            self.cursor.fetchall(),
+            [
+                ( self.multiple_station, 2, 2, ),
+                ( self.single_station,   1, 1, ),
+            ],
+        )
+
+    def setUp( self ):
+        self.directory = tempfile.TemporaryDirectory()
+        self.conn      = helpers.create_database( self.directory.name )
+        self.cursor    = self.conn.cursor()
+
+        sd.add_study(
+            self.cursor,
+            flow_class=flow_class,
+            year=year,
+            study_number=study_number,
+            study_type=sd.DIRECT_NUMERICAL_SIMULATION_STUDY_TYPE,
+        )
+        sd.add_series(
+            self.cursor,
+            flow_class=flow_class,
+            year=year,
+            study_number=study_number,
+            series_number=1,
+            number_of_dimensions=2,
+            coordinate_system=sd.CYLINDRICAL_COORDINATE_SYSTEM,
+        )
+
+        self.multiple_station = self.add_station( 1, [ 1000.0, 5000.0, ], \
+                                                     [ 0.010,  0.020,  ] )
+        self.single_station   = self.add_station( 2, [ 3000.0, ], \
+                                                     [ 0.030,  ] )
+
+        sd.create_station_summary( self.cursor )
+        self.conn.commit()
+
+    def tearDown( self ):
+        self.conn.close()
+        self.directory.cleanup()
+
+if ( __name__ == "__main__" ):
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 Andrew Trettel
+#
+# SPDX-License-Identifier: MIT
+
+import unittest
+
+import helpers
+import numpy as np
+from uncertainties import unumpy as unp
+import sheardata as sd
+
+# Checks the vectorized trapezoid rule against integrating one interval at a
+# time with the uncertainties package, which is exact for linear propagation.
+
+r_nominal = np.array( [ 0.000, 0.010, 0.025, 0.040, 0.050, ] )
+r_std_dev = np.array( [ 0.000, 0.001, 0.001, 0.002, 0.001, ] )
+u_nominal = np.array( [ 20.00, 19.50, 17.00, 13.00, 0.000, ] )
+u_std_dev = np.array( [ 0.300, 0.300, 0.200, 0.400, 0.000, ] )
+
+def integrate_one_interval_at_a_time( x, f, F0 ):
+    F = [ F0 ]
+    for i in range(len(x)-1):
+        F.append( F[-1] + 0.5 * ( x[i+1] - x[i] ) * ( f[i+1] + f[i] ) )
+    return F
+
+class TestTrapezoidRule( unittest.TestCase ):
+    def assertSameUfloat( self, value, expected ):
+        self.assertAlmostEqual( value.n, expected.n, places=12 )
+        self.assertAlmostEqual( value.s, expected.s, places=12 )
+
+    def test_independent_points( self ):
+        expected = integrate_one_interval_at_a_time(
+            unp.uarray( r_nominal, r_std_dev ),
+            unp.uarray( u_nominal, u_std_dev ),
+            sd.sdfloat( 0.0, 0.0 ),
+        )
+
+        F = sd.cumulatively_integrate_using_trapezoid_rule(
+            sd.SDArray( r_nominal, r_std_dev ),
+            sd.SDArray( u_nominal, u_std_dev ),
+        )
+        self.assertIsInstance( F, sd.SDArray )
+        self.assertEqual( len(F), len(expected) )
+        for value, expected_value in zip( F, expected ):
+            self.assertSameUfloat( value, expected_value )
+
+        self.assertSameUfloat(
+            sd.integrate_using_trapezoid_rule(
+                sd.SDArray( r_nominal, r_std_dev ),
+                sd.SDArray( u_nominal, u_std_dev ),
+            ),
+            expected[-1],
+        )
+
+    # An initial value with an uncertainty stays correlated with the result.
+    def test_initial_value( self ):
+        F0 = sd.sdfloat( 0.5, 0.01 )
+        F  = sd.integrate_using_trapezoid_rule(
+            sd.SDArray( r_nominal, r_std_dev ),
+            sd.SDArray( u_nominal, u_std_dev ),
+            F0=F0,
+        )
+        expected = integrate_one_interval_at_a_time(
+            unp.uarray( r_nominal, r_std_dev ),
+            unp.uarray( u_nominal, u_std_dev ),
+            F0,
+        )[-1]
+        self.assertSameUfloat( F, expected )
+        self.assertAlmostEqual( ( F - F0 ).s**2.0, F.s**2.0 - F0.s**2.0, places=12 )
+
+    def test_exact_points( self ):
+        F = sd.integrate_using_trapezoid_rule( r_nominal, u_nominal )
+        self.assertAlmostEqual(
+            F.n,
+            integrate_one_interval_at_a_time( r_nominal, u_nominal, 0.0 )[-1],
+            places=12,
+        )
+        self.assertEqual( F.s, 0.0 )
+
+    # The integrand u*r is correlated with the coordinates r, as for the
+    # volumetric flow rate of a pipe.
+    def test_integrand_calculated_from_coordinates( self ):
+        r = unp.uarray( r_nominal, r_std_dev )
+        u = unp.uarray( u_nominal, u_std_dev )
+        expected = integrate_one_interval_at_a_time(
+            r,
+            u * r,
+            sd.sdfloat( 0.0, 0.0 ),
+        )
+
+        F = sd.integrate_using_trapezoid_rule( r, u * r )
+        self.assertSameUfloat( F, expected[-1] )
+
+        # The result stays correlated with its inputs.
+        self.assertAlmostEqual( ( F - expected[-1] ).s, 0.0, places=12 )
+
+        # Treating the points as uncorrelated gives a different uncertainty.
+        independent = sd.integrate_using_trapezoid_rule(
+            sd.to_sdarray( r ),
+            sd.to_sdarray( u * r ),
+        )
+        self.assertAlmostEqual( independent.n, F.n, places=12 )
+        self.assertNotAlmostEqual( independent.s, F.s, places=6 )
+
+        cumulative = sd.cumulatively_integrate_using_trapezoid_rule( r, u * r )
+        for value, expected_value in zip( cumulative, expected ):
+            self.assertSameUfloat( value, expected_value )
+
+    def test_empty_profile( self ):
+        F0 = sd.sdfloat( 1.0, 0.1 )
+        self.assertIs( sd.integrate_using_trapezoid_rule( [], [], F0=F0 ), F0 )
+
+if ( __name__ == "__main__" ):
+    unittest.main()